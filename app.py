@@ -1,14 +1,17 @@
 import streamlit as st
 from resume_template import generate_resume
 from utils.pdf_generator import create_pdf
-from utils.gemini_utils import initialize_gemini, analyze_resume_content, get_ats_optimization, apply_ai_suggestions
+from utils.gemini_utils import initialize_gemini, analyze_resume_bundle, is_analysis_error, run_in_thread, apply_ai_suggestions
 from utils.resume_parser import ResumeParser
+import io
 import os
+import re
+import json
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from importlib import import_module
 
 # Set page config
 st.set_page_config(
@@ -19,25 +22,55 @@ st.set_page_config(
 )
 
 # Custom CSS for minimalistic design
+CSS_PATH = "static/styles.css"
+
+@st.cache_data(show_spinner=False)
+def _css(path: str, mtime: float) -> str:
+    """Read the stylesheet once per modification instead of on every rerun"""
+    with open(path) as f:
+        return f.read()
+
 def load_css():
-    with open("static/styles.css") as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    st.markdown(f"<style>{_css(CSS_PATH, os.path.getmtime(CSS_PATH))}</style>", unsafe_allow_html=True)
 
 load_css()
 
+# Static page markup, built once at import
+HEADER_HTML = """ <div class="header">
+        <div class="header-content">
+            <h1 class="header-title">R.E.A.D.M.L.</h1>
+            <h2 class="header-subtitle">Resume Enhancing, Analyzing & Developing using Machine Learning</h2>
+            <div class="header-divider"></div>
+            <div class="header-description">
+                    Elevate your resume with AI-powered optimization. Our intelligent system crafts professional, 
+    ATS-friendly resumes while providing smart suggestions to make your experience stand out.
+            </div>
+        </div>
+    </div>
+    """
+
+UPLOAD_TITLE_HTML = """
+    <div class="section-title text-center">
+        <h2>Resume Analysis</h2>
+        <p>Upload your existing resume for comprehensive AI-powered analysis</p>
+    </div>
+    """
+
 def initialize_session_state():
     """Initialize all session state variables"""
     if 'resume_data' not in st.session_state:
         st.session_state.resume_data = None
-    if 'pdf_path' not in st.session_state:
-        st.session_state.pdf_path = None
+    if 'resume_key' not in st.session_state:
+        st.session_state.resume_key = None
+    if 'pdf_bytes' not in st.session_state:
+        st.session_state.pdf_bytes = None
     if 'projects' not in st.session_state:
         st.session_state.projects = [{
             'title': '',
             'duration': '',
             'tools': '',
             'description': '',
-            'responsibilities': ''
+            'responsibilities': []
         }]
     if 'form_data' not in st.session_state:
         st.session_state.form_data = {
@@ -47,8 +80,6 @@ def initialize_session_state():
             'skills': {},
             'achievements': {}
         }
-    if 'resume_parser' not in st.session_state:
-        st.session_state.resume_parser = ResumeParser()
     if 'parsed_resume' not in st.session_state:
         st.session_state.parsed_resume = {
             'scores': {
@@ -81,98 +112,248 @@ def save_form_data(form_data):
     """Save form data to session state"""
     st.session_state.form_data = form_data
 
+def _list_to_lines(items):
+    """Join a stored list for display in a text area, one item per line"""
+    return "\n".join(items)
+
+def _lines_to_list(text, current=None):
+    """Split a text area into a list of lines
+    
+    The stored list is reused as-is when the text wasn't edited.
+    """
+    if current is not None and text == _list_to_lines(current):
+        return current
+    return text.split("\n") if text else []
+
+# Required form fields as (section, field) paths with their error messages
+REQUIRED_FIELDS = [
+    (('personal_info', 'name'), "Full name is required"),
+    (('personal_info', 'email'), "Email is required"),
+    (('personal_info', 'phone'), "Phone number is required"),
+    (('personal_info', 'location'), "Current location is required"),
+    (('education', 'university'), "University name is required"),
+    (('education', 'degree'), "Degree is required"),
+    (('profile_summary', 'target_role'), "Target role is required"),
+    (('profile_summary', 'summary'), "Profile summary is required"),
+    (('skills', 'programming'), "Programming skills are required")
+]
+
+# Required project fields with the error message suffix
+PROJECT_REQUIRED_FIELDS = [
+    ('title', "title is required"),
+    ('duration', "duration is required"),
+    ('tools', "tools are required"),
+    ('description', "description is required"),
+    ('responsibilities', "responsibilities are required")
+]
+
+# Project text widgets as (field, label, key prefix, placeholder, text area height)
+PROJECT_WIDGETS = [
+    ('title', "Title", "title_", "Enter project title", None),
+    ('duration', "Duration", "duration_", "Enter project duration (e.g., Jan 2023 - Present)", None),
+    ('tools', "Tools", "tools_", "List technologies used (e.g., React, Node.js, MongoDB)", None),
+    ('description', "Description", "desc_", "Describe your project's purpose and key features...", 150)
+]
+
+def _list_to_csv(items):
+    """Join a stored skills list for display in a text input"""
+    return ", ".join(items)
+
+# Comma separator with its surrounding whitespace, so split items come out stripped
+_CSV_RE = re.compile(r"\s*,\s*")
+
+def _strip_items(items):
+    """Strip each item, dropping the ones left empty"""
+    return [item for item in (part.strip() for part in items) if item]
+
+def _csv_to_list(text, current=None):
+    """Split a comma separated text input into a list of non-empty items
+    
+    The stored list is reused as-is when the text wasn't edited.
+    """
+    if current is not None and text == _list_to_csv(current):
+        return current
+    text = text.strip()
+    if not text:
+        return []
+    return [item for item in _CSV_RE.split(text) if item]
+
 def validate_form(form_data, projects):
     """Validate all required fields"""
-    errors = []
+    errors = [message for (section, field), message in REQUIRED_FIELDS
+              if not form_data[section].get(field)]
+    errors += [f"Project {i+1} {message}"
+               for i, project in enumerate(projects)
+               for field, message in PROJECT_REQUIRED_FIELDS
+               if not project.get(field)]
+    return errors
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_model(api_key):
+    """Create the Gemini model once per process and share it across sessions"""
+    return initialize_gemini(api_key)
+
+@st.cache_resource(show_spinner="Loading language model...")
+def get_resume_parser():
+    """Load the spaCy-backed resume parser once per process"""
+    return ResumeParser()
+
+# Initialize Gemini API
+def initialize_ai():
+    """Initialize AI components"""
+    try:
+        api_key = st.secrets.api_keys.GEMINI_API_KEY
+        if not api_key:
+            st.error("Gemini API key not found. Please check your secrets.toml file.")
+            return None
+        
+        model = get_gemini_model(api_key)
+        if not model:
+            # initialize_gemini already reported the failure; don't cache it so
+            # the next run retries
+            get_gemini_model.clear(api_key)
+        return model
+    except Exception as e:
+        st.error(f"Error initializing AI: {str(e)}")
+        st.info("""
+        Please check:
+        1. Your API key is correct in .streamlit/secrets.toml
+        2. You have internet connection
+        3. The API service is available
+        """)
+        return None
+
+def resume_cache_key(resume_data):
+    """Fingerprint resume data into a stable key for the st.cache_data wrappers"""
+    canonical = json.dumps(resume_data, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_resume_analysis(resume_key, _model, _resume_data):
+    """Memoize the Gemini analyses; only resume_key is hashed by Streamlit"""
+    return analyze_resume_bundle(_model, _resume_data)
+
+def get_resume_analysis(model, resume_data, resume_key=None):
+    """Get AI analysis for resume data, reusing results for unchanged content"""
+    if resume_key is None:
+        resume_key = resume_cache_key(resume_data)
+    analysis = cached_resume_analysis(resume_key, model, resume_data)
     
-    # Personal info validation
-    if not form_data['personal_info'].get('name'):
-        errors.append("Full name is required")
-    if not form_data['personal_info'].get('email'):
-        errors.append("Email is required")
-    if not form_data['personal_info'].get('phone'):
-        errors.append("Phone number is required")
-    if not form_data['personal_info'].get('location'):
-        errors.append("Current location is required")
+    # Don't keep rate-limit or API failures around for the whole TTL
+    if any(is_analysis_error(text) for text in analysis.values()):
+        cached_resume_analysis.clear(resume_key, model, resume_data)
     
-    # Education validation
-    if not form_data['education'].get('university'):
-        errors.append("University name is required")
-    if not form_data['education'].get('degree'):
-        errors.append("Degree is required")
+    return analysis
+
+async def analyze_upload(model, file_hash, job_description, parsed_data, resume_data):
+    """Run the job-description ATS scoring alongside the Gemini analysis"""
+    analysis_task = asyncio.create_task(run_in_thread(get_resume_analysis, model, resume_data))
     
-    # Profile validation
-    if not form_data['profile_summary'].get('target_role'):
-        errors.append("Target role is required")
-    if not form_data['profile_summary'].get('summary'):
-        errors.append("Profile summary is required")
+    # Calculate ATS score with job description if provided
+    if job_description:
+        parsed_data['scores'] = await run_in_thread(
+            score_resume,
+            file_hash,
+            job_description,
+            parsed_data['full_text']
+        )
     
-    # Skills validation
-    if not form_data['skills'].get('programming'):
-        errors.append("Programming skills are required")
+    return await analysis_task
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_pdf(resume_key, _resume_data):
+    """Render the resume PDF once per distinct resume data"""
+    return create_pdf(generate_resume(_resume_data))
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def parse_resume(file_hash, file_name, _file_bytes):
+    """Parse an uploaded resume once per distinct file content
     
-    # Projects validation
-    for i, project in enumerate(projects):
-        if not project.get('title'):
-            errors.append(f"Project {i+1} title is required")
-        if not project.get('duration'):
-            errors.append(f"Project {i+1} duration is required")
-        if not project.get('tools'):
-            errors.append(f"Project {i+1} tools are required")
-        if not project.get('description'):
-            errors.append(f"Project {i+1} description is required")
-        if not project.get('responsibilities'):
-            errors.append(f"Project {i+1} responsibilities are required")
+    Returns (parsed_data, error) and makes no st.* calls, so it can run on the
+    prefetch pool; the caller reports the error from the script thread.
+    """
+    file = io.BytesIO(_file_bytes)
+    file.name = file_name
+    try:
+        return get_resume_parser().get_parsed_data(file), None
+    except ValueError as e:
+        return None, str(e)
+
+@st.cache_resource(show_spinner=False)
+def get_parse_executor():
+    """Shared worker pool for parsing uploads in the background"""
+    # Default sizing (min(32, cpus + 4)) so uploads from different sessions don't queue
+    # behind a couple of workers
+    return ThreadPoolExecutor(thread_name_prefix="resume-parse")
+
+def prefetch_parse(file_hash, file_name, file_bytes):
+    """Start parsing an upload as soon as it arrives, before Analyze is clicked
     
-    return errors
+    The future is kept per session and only replaced when a different file is uploaded.
+    """
+    prefetch = st.session_state.get('parse_prefetch')
+    if prefetch is None or prefetch[0] != file_hash:
+        if prefetch is not None:
+            # The previous upload was replaced; skip its parse if it hasn't started
+            prefetch[1].cancel()
+        # Load the language model here, where its spinner can be shown
+        get_resume_parser()
+        prefetch = (file_hash, get_parse_executor().submit(parse_resume, file_hash, file_name, file_bytes))
+        st.session_state.parse_prefetch = prefetch
+    return prefetch[1]
 
-# Initialize Gemini API
-def initialize_ai():
-    """Initialize AI components"""
-    if 'gemini_model' not in st.session_state:
-        try:
-            api_key = st.secrets.api_keys.GEMINI_API_KEY
-            if not api_key:
-                st.error("Gemini API key not found. Please check your secrets.toml file.")
-                return
-            
-            model = initialize_gemini(api_key)
-            if model:
-                st.session_state.gemini_model = model
-            else:
-                st.error("Failed to initialize AI analysis system. Please check your API key.")
-        except Exception as e:
-            st.error(f"Error initializing AI: {str(e)}")
-            st.info("""
-            Please check:
-            1. Your API key is correct in .streamlit/secrets.toml
-            2. You have internet connection
-            3. The API service is available
-            """)
-            return None
+@st.cache_data(max_entries=32, show_spinner=False)
+def score_resume(file_hash, job_description, _full_text):
+    """Calculate the ATS score once per resume file and job description"""
+    return get_resume_parser().calculate_ats_score(_full_text, job_description)
 
-def render_resume_upload_section():
-    """Render the resume upload and analysis section"""
-    # Ensure Gemini model is initialized
-    if 'gemini_model' not in st.session_state:
-        try:
-            api_key = st.secrets.api_keys.GEMINI_API_KEY
-            if not api_key:
-                st.error("Gemini API key not found. Please check your secrets.toml file.")
-                return
-            model = initialize_gemini(api_key)
-            if model:
-                st.session_state.gemini_model = model
-        except Exception as e:
-            st.error(f"Error initializing AI: {str(e)}")
-            return
+# Parsed sections that are already mapped into dedicated resume_data fields
+PARSED_SECTION_SKIP = frozenset({'summary', 'objective', 'education', 'skills', 'projects'})
 
-    st.markdown("""
-    <div class="section-title text-center">
-        <h2>Resume Analysis</h2>
-        <p>Upload your existing resume for comprehensive AI-powered analysis</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.cache_data(max_entries=16, show_spinner=False)
+def normalize_parsed(file_hash, job_description, _parsed_data):
+    """Convert parsed resume data into the resume_data format used for AI analysis"""
+    sections = _parsed_data['sections']
+    objective = sections.get('objective')
+    education = sections.get('education')
+    
+    resume_data = {
+        'profile_summary': {
+            'target_role': job_description[:100] if job_description else sections.get('role', objective.partition('\n')[0] if objective else 'Not specified'),
+            'summary': sections.get('summary', objective or '')
+        },
+        'skills': {
+            'programming': _strip_items(_parsed_data['skills']),
+            'frameworks': _strip_items(_parsed_data.get('frameworks', [])),
+            'other': _strip_items(_parsed_data.get('other_skills', []))
+        },
+        'education': {
+            'university': education.partition('\n')[0] if education else 'Not specified',
+            'degree': sections.get('degree', education if education is not None else 'Not specified')
+        },
+        'projects': [
+            {
+                'title': project.get('title', ''),
+                'description': project.get('description', ''),
+                'responsibilities': project.get('responsibilities', '').split('\n'),
+                'tools': project.get('tools', ''),
+                'duration': project.get('duration', '')
+            }
+            for project in _parsed_data.get('projects') or []
+        ]
+    }
+    
+    # Add any additional sections found in parsed data
+    for section_name, content in sections.items():
+        section_key = section_name.lower()
+        if section_key not in PARSED_SECTION_SKIP:
+            resume_data[section_key] = content
+    
+    return resume_data
+
+def render_resume_upload_section(model):
+    """Render the resume upload and analysis section"""
+    st.markdown(UPLOAD_TITLE_HTML, unsafe_allow_html=True)
     
     uploaded_file = st.file_uploader(
         "Upload your resume (PDF or DOCX)",
@@ -180,6 +361,12 @@ def render_resume_upload_section():
         help="We support PDF and DOCX formats"
     )
     
+    if uploaded_file:
+        # Parse in the background while the job description is being filled in
+        file_bytes = uploaded_file.getvalue()
+        file_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+        parse_future = prefetch_parse(file_hash, uploaded_file.name, file_bytes)
+    
     job_description = st.text_area(
         "Paste the job description (optional)",
         height=150,
@@ -193,715 +380,705 @@ def render_resume_upload_section():
     
     if uploaded_file and analyze_button:
         try:
-            # Parse resume
-            parsed_data = st.session_state.resume_parser.get_parsed_data(uploaded_file)
+            # The background parse makes no st.* calls, so its error is shown here
+            parsed_data, error = parse_future.result()
+            if error:
+                st.error(error)
+            elif parsed_data:
+                # Copy it, since the ATS score is replaced per job description
+                parsed_data = dict(parsed_data)
             
             if parsed_data:
-                # Calculate ATS score with job description if provided
-                if job_description:
-                    parsed_data['scores'] = st.session_state.resume_parser.calculate_ats_score(
-                        parsed_data['full_text'],
-                        job_description
-                    )
-                
-                st.session_state.parsed_resume = parsed_data
-                
-                # Convert parsed data to format expected by Gemini analysis
-                resume_data = {
-                    'profile_summary': {
-                        'target_role': job_description[:100] if job_description else parsed_data['sections'].get('role', parsed_data['sections'].get('objective', '').split('\n')[0] if parsed_data['sections'].get('objective') else 'Not specified'),
-                        'summary': parsed_data['sections'].get('summary', parsed_data['sections'].get('objective', ''))
-                    },
-                    'skills': {
-                        'programming': [skill.strip() for skill in parsed_data['skills'] if skill.strip()],
-                        'frameworks': [skill.strip() for skill in parsed_data.get('frameworks', []) if skill.strip()],
-                        'other': [skill.strip() for skill in parsed_data.get('other_skills', []) if skill.strip()]
-                    },
-                    'education': {
-                        'university': parsed_data['sections'].get('education', '').split('\n')[0] if parsed_data['sections'].get('education') else 'Not specified',
-                        'degree': parsed_data['sections'].get('degree', parsed_data['sections'].get('education', 'Not specified'))
-                    },
-                    'projects': [
-                        {
-                            'title': project.get('title', ''),
-                            'description': project.get('description', ''),
-                            'responsibilities': project.get('responsibilities', '').split('\n'),
-                            'tools': project.get('tools', ''),
-                            'duration': project.get('duration', '')
-                        }
-                        for project in parsed_data.get('projects', [])
-                    ] if parsed_data.get('projects') else []
-                }
-
-                # Add any additional sections found in parsed data
-                for section_name, content in parsed_data['sections'].items():
-                    if section_name.lower() not in ['summary', 'objective', 'education', 'skills', 'projects']:
-                        resume_data[section_name.lower()] = content
-                
                 # Get AI analysis using the same functions as generated resumes
-                if not st.session_state.gemini_model:
+                if not model:
                     st.error("AI model not initialized. Please check your API configuration.")
                     return
+                
+                # Convert parsed data to format expected by Gemini analysis
+                resume_data = normalize_parsed(file_hash, job_description, parsed_data)
 
                 st.markdown("## AI Resume Analysis")
                 with st.spinner("Analyzing your resume with AI..."):
-                    # Get AI analysis
-                    analysis = analyze_resume_content(st.session_state.gemini_model, resume_data)
-                    ats_analysis = get_ats_optimization(st.session_state.gemini_model, resume_data)
+                    # Score against the job description while Gemini analyzes the resume
+                    analysis = asyncio.run(analyze_upload(model, file_hash, job_description, parsed_data, resume_data))
+                    st.session_state.parsed_resume = parsed_data
                     
                     # Store analysis in session state for later use
-                    st.session_state.ai_analysis = {
-                        'profile_analysis': analysis['profile_analysis'],
-                        'skills_analysis': analysis['skills_analysis'],
-                        'ats_analysis': ats_analysis['ats_analysis']
-                    }
-
-                    # Create tabs for different analysis sections
-                    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-                        "ATS Score", 
-                        "Profile Analysis",
-                        "Skills Analysis",
-                        "Optimization",
-                        "Summary Report",
-                        "Visualization"
-                    ])
-                    
-                    with tab1:
-                        st.subheader("ATS Compatibility Score")
-                        
-                        # Overall ATS Score at the top
-                        total_score = parsed_data['scores']['total_score']
-                        st.markdown(f"""
-                        <div class='ats-score-container'>
-                            <h2>Overall ATS Score: {total_score}%</h2>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        # Create a DataFrame for the score breakdown
-                        score_breakdown = pd.DataFrame({
-                            'Component': [
-                                'Format & Structure',
-                                'Content Quality',
-                                'Skills Coverage',
-                                'Keyword Match',
-                                'Readability'
-                            ],
-                            'Maximum Points': [15, 25, 25, 25, 10],
-                            'Your Score': [
-                                parsed_data['scores']['format_score'],
-                                parsed_data['scores']['content_score'],
-                                parsed_data['scores']['skills_score'],
-                                parsed_data['scores']['keyword_score'],
-                                parsed_data['scores']['readability_score']
-                            ]
-                        })
-                        
-                        # Display the score breakdown as a styled table
-                        st.markdown("### Score Breakdown")
-                        st.dataframe(
-                            score_breakdown.style
-                            .set_properties(**{'text-align': 'left'})
-                            .bar(subset=['Your Score'], color='#0068c9', vmin=0, vmax=25)
-                            .format({'Maximum Points': '{:.0f}', 'Your Score': '{:.1f}'}),
-                            use_container_width=True
-                        )
-                        
-                        # Display individual score components with progress bars
-                        st.markdown("### Detailed Component Analysis")
-                        for _, row in score_breakdown.iterrows():
-                            col1, col2 = st.columns([3, 1])
-                            with col1:
-                                progress = (row['Your Score'] / row['Maximum Points']) * 100
-                                st.markdown(f"**{row['Component']}**")
-                                st.progress(progress / 100)
-                            with col2:
-                                st.markdown(f"**{row['Your Score']:.1f}/{row['Maximum Points']:.0f}**")
-                            st.markdown("---")
-                        
-                        # Add score interpretation
-                        st.markdown("### Score Interpretation")
-                        if total_score >= 85:
-                            st.success("Your resume is well-optimized for ATS systems! 🌟")
-                        elif total_score >= 70:
-                            st.warning("Your resume meets basic ATS requirements but has room for improvement. 📈")
-                        else:
-                            st.error("Your resume needs significant optimization for better ATS performance. 🎯")
-                    
-                    with tab2:
-                        st.subheader("Profile Analysis")
-                        st.markdown(analysis['profile_analysis'])
-                    
-                    with tab3:
-                        st.subheader("Skills Analysis")
-                        try:
-                            # Get skills data based on the source (uploaded or generated)
-                            skills_data = {}
-                            
-                            if 'parsed_resume' in st.session_state and st.session_state.parsed_resume:
-                                # For uploaded resumes
-                                skills_data = {
-                                    'programming_languages': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('programming_languages', []),
-                                    'frameworks_libraries': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('frameworks_libraries', []),
-                                    'soft_skills': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('soft_skills', []),
-                                    'tools_technologies': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('tools_technologies', [])
-                                }
-                            elif 'resume_data' in st.session_state and st.session_state.resume_data:
-                                # For generated resumes
-                                skills = st.session_state.resume_data.get('skills', {})
-                                skills_data = {
-                                    'programming_languages': skills.get('programming', []),
-                                    'frameworks_libraries': skills.get('frameworks', []),
-                                    'soft_skills': skills.get('soft_skills', []),
-                                    'tools_technologies': skills.get('tools', [])
-                                }
-                                
-                                # Clean up empty strings from lists
-                                for category in skills_data:
-                                    skills_data[category] = [skill.strip() for skill in skills_data[category] if skill.strip()]
-
-                            if not any(skills_data.values()):
-                                st.warning("No skills data available. Please ensure your resume includes skills information.")
-                                return
-
-                            # Technical Skills Analysis
-                            st.markdown("### Technical Skills Analysis")
-                            
-                            # Programming Languages
-                            if skills_data.get('programming_languages'):
-                                st.markdown("""
-                                #### Programming Languages
-                                Your resume demonstrates proficiency in multiple programming languages. Here's a detailed analysis:
-                                """)
-                                
-                                langs = sorted(skills_data['programming_languages'])
-                                st.markdown("**Core Languages:**")
-                                st.markdown("\n".join([f"• `{lang}` - Demonstrated through projects and experience" 
-                                                    for lang in langs[:3]]))
-                                
-                                if len(langs) > 3:
-                                    st.markdown("\n**Additional Languages:**")
-                                    st.markdown("\n".join([f"• `{lang}`" for lang in langs[3:]]))
-                                
-                                st.markdown("""
-                                **Analysis:**
-                                Your programming language portfolio shows a good mix of modern and established technologies.
-                                Consider focusing on deepening expertise in your core languages while maintaining working
-                                knowledge of others.
-                                """)
-
-                            # Frameworks and Libraries
-                            if skills_data.get('frameworks_libraries'):
-                                st.markdown("""
-                                #### Frameworks & Libraries
-                                Your technical stack includes various frameworks and libraries:
-                                """)
-                                
-                                frameworks = sorted(skills_data['frameworks_libraries'])
-                                for fw in frameworks:
-                                    st.markdown(f"• `{fw}`")
-                                
-                                st.markdown("""
-                                **Framework Proficiency:**
-                                Your experience with these frameworks indicates a solid foundation in software development.
-                                This diverse knowledge base allows you to adapt to different project requirements and
-                                technical environments.
-                                """)
-
-                            # Professional Skills Analysis
-                            st.markdown("### Professional Skills Analysis")
-                            
-                            if skills_data.get('soft_skills'):
-                                st.markdown("""
-                                #### Soft Skills & Professional Competencies
-                                Your resume demonstrates the following professional capabilities:
-                                """)
-                                
-                                soft_skills = sorted(skills_data['soft_skills'])
-                                for skill in soft_skills:
-                                    st.markdown(f"• {skill}")
-                                
-                                st.markdown("""
-                                **Professional Impact:**
-                                Your soft skills complement your technical abilities, showing a well-rounded
-                                professional profile. These skills are particularly valuable for:
-                                • Team collaboration and leadership roles
-                                • Project management and coordination
-                                • Client interaction and communication
-                                """)
-
-                            # Tools and Technologies
-                            if skills_data.get('tools_technologies'):
-                                st.markdown("""
-                                #### Tools & Technologies
-                                Your proficiency extends to various development tools and technologies:
-                                """)
-                                
-                                tools = sorted(skills_data['tools_technologies'])
-                                for tool in tools:
-                                    st.markdown(f"• `{tool}`")
-                                
-                                st.markdown("""
-                                **Technical Environment:**
-                                Your experience with these tools indicates familiarity with modern development
-                                practices and environments. This toolkit supports efficient development workflows
-                                and collaborative work.
-                                """)
-
-                            # Overall Skills Assessment
-                            st.markdown("### Overall Skills Assessment")
-                            
-                            # Calculate total skills and distributions
-                            total_skills = sum(len(skills) for skills in skills_data.values())
-                            
-                            st.markdown(f"""
-                            #### Comprehensive Analysis
-                            
-                            Your skill profile includes {total_skills} distinct competencies across various categories.
-                            The distribution shows:
-                            """)
-                            
-                            for category, skills in skills_data.items():
-                                if skills:
-                                    percentage = (len(skills) / total_skills) * 100
-                                    st.markdown(f"• **{category.replace('_', ' ').title()}**: {len(skills)} skills ({percentage:.1f}%)")
-                            
-                            st.markdown("""
-                            #### Key Observations
-                            
-                            1. **Technical Depth**
-                               - Your technical skills show both breadth and depth
-                               - Good balance between fundamental and specialized technologies
-                               - Evidence of continuous learning and adaptation
-                            
-                            2. **Professional Development**
-                               - Strong foundation in core development practices
-                               - Demonstrated ability to work with modern tools
-                               - Clear progression in skill acquisition
-                            
-                            3. **Areas of Excellence**
-                               - Solid programming language foundation
-                               - Practical experience with industry-standard tools
-                               - Balance of technical and soft skills
-                            """)
-
-                            # Recommendations
-                            st.markdown("""
-                            ### Recommendations for Growth
-                            
-                            Based on your current skill set, consider:
-                            
-                            1. **Skill Enhancement**
-                               - Deepen expertise in your primary programming languages
-                               - Stay updated with the latest versions and features
-                               - Practice through complex projects
-                            
-                            2. **Knowledge Expansion**
-                               - Explore complementary technologies
-                               - Focus on high-demand areas in your field
-                               - Maintain awareness of industry trends
-                            
-                            3. **Professional Development**
-                               - Seek opportunities to lead technical initiatives
-                               - Share knowledge through mentoring or documentation
-                               - Contribute to open-source projects
-                            """)
-
-                        except Exception as e:
-                            st.error(f"An error occurred in skills analysis: {str(e)}")
-                            st.info("Please ensure your resume includes skills information and try again.")
-                    
-                    with tab4:
-                        st.subheader("ATS Analysis")
-                        
-                        if 'scores' in st.session_state.parsed_resume:
-                            scores = st.session_state.parsed_resume['scores']
-                            
-                            # Core ATS Analysis
-                            st.markdown("### ATS Score Overview")
-                            
-                            # Display scores in a clean layout
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                st.metric(
-                                    "Overall ATS Score",
-                                    f"{scores.get('total_score', 0)}%",
-                                    delta="Target: 85%+" if scores.get('total_score', 0) < 85 else None,
-                                    delta_color="inverse"
-                                )
-                                
-                            with col2:
-                                st.metric(
-                                    "Keyword Match",
-                                    f"{scores.get('keyword_score', 0)}%",
-                                    delta="Target: 80%+" if scores.get('keyword_score', 0) < 80 else None,
-                                    delta_color="inverse"
-                                )
-                                
-                            with col3:
-                                st.metric(
-                                    "Format Score",
-                                    f"{scores.get('format_score', 0)}%",
-                                    delta="Target: 90%+" if scores.get('format_score', 0) < 90 else None,
-                                    delta_color="inverse"
-                                )
-                                
-                            # Score Breakdown
-                            st.markdown("### Score Breakdown")
-                            scores_df = pd.DataFrame({
-                                'Category': [
-                                    'Content Quality',
-                                    'Skills Coverage',
-                                    'Keyword Optimization',
-                                    'Format & Structure',
-                                    'Readability'
-                                ],
-                                'Score': [
-                                    scores.get('content_score', 0),
-                                    scores.get('skills_score', 0),
-                                    scores.get('keyword_score', 0),
-                                    scores.get('format_score', 0),
-                                    scores.get('readability_score', 0)
-                                ]
-                            })
-                            
-                            # Display as bar chart
-                            st.bar_chart(scores_df.set_index('Category'))
-                            
-                            # Quick Summary
-                            total_score = scores.get('total_score', 0)
-                            if total_score >= 85:
-                                st.success("Your resume is well-optimized for ATS systems.")
-                            elif total_score >= 70:
-                                st.warning("Your resume meets basic ATS requirements but has room for improvement.")
-                            else:
-                                st.error("Your resume may need optimization for better ATS performance.")
-                            
-                        else:
-                            st.warning("No ATS analysis data available. Please ensure your resume has been properly analyzed.")
-                            
-                            st.markdown(ats_analysis['ats_analysis'])
-                        
-                    with tab5:
-                        st.subheader("Executive Summary Report")
-                        
-                        if 'scores' in st.session_state.parsed_resume:
-                            total_score = st.session_state.parsed_resume['scores'].get('total_score', 0)
-                            
-                            # Overall Assessment
-                            st.markdown("### Overall Assessment")
-                            st.markdown("""
-                            Your resume has been analyzed across multiple dimensions including content quality, 
-                            ATS compatibility, skills presentation, and overall professional impact. Here's a 
-                            comprehensive summary of the findings:
-                            """)
-                            
-                            # Core Metrics Summary
-                            st.markdown("#### Key Performance Metrics")
-                            st.markdown(f"""
-                            Your resume achieved an overall score of **{total_score}%** with the following key observations:
-
-                            • **Content Strength**: {st.session_state.parsed_resume['scores'].get('content_score', 0)}%
-                            - Measures the quality and relevance of your professional experience
-                            - Evaluates the impact and clarity of your achievements
-                            
-                            • **ATS Compatibility**: {st.session_state.parsed_resume['scores'].get('keyword_score', 0)}%
-                            - Assesses how well your resume aligns with ATS systems
-                            - Evaluates keyword optimization and format compliance
-                            
-                            • **Skills Presentation**: {st.session_state.parsed_resume['scores'].get('skills_score', 0)}%
-                            - Analyzes the breadth and depth of your technical capabilities
-                            - Evaluates how effectively skills are contextualized
-                            """)
-                            
-                            # Profile Analysis Summary
-                            st.markdown("#### Professional Profile Analysis")
-                            st.markdown("""
-                            Your professional profile demonstrates the following characteristics:
-                            
-                            • **Experience Presentation**
-                            - Career progression and achievements are effectively structured
-                            - Professional impact is quantified where applicable
-                            - Key responsibilities align with industry expectations
-                            
-                            • **Technical Expertise**
-                            - Demonstrates proficiency in relevant technical domains
-                            - Shows adaptability across different technologies
-                            - Highlights practical application of skills
-                            
-                            • **Professional Development**
-                            - Shows continuous learning and skill advancement
-                            - Indicates ability to adapt to industry changes
-                            - Demonstrates professional growth trajectory
-                            """)
-
-                            # Skills Distribution
-                            if 'skills_data' in locals():
-                                st.markdown("#### Skills Distribution")
-                                st.markdown("""
-                                Your skill set demonstrates the following distribution:
-                                
-                                • **Technical Competencies**
-                                - Programming Languages: Core and supplementary technologies
-                                - Frameworks & Tools: Industry-standard development tools
-                                - Technical Methodologies: Development and deployment practices
-                                
-                                • **Professional Capabilities**
-                                - Project Management: Planning and execution abilities
-                                - Team Collaboration: Communication and leadership skills
-                                - Problem Solving: Analytical and strategic thinking
-                                """)
-                            
-                            # Overall Impact
-                            st.markdown("#### Overall Professional Impact")
-                            if total_score >= 85:
-                                impact_assessment = """
-                                Your resume presents a **strong professional profile** with:
-                                
-                                • **Exceptional Qualities**
-                                - Well-optimized for ATS systems
-                                - Clear demonstration of professional expertise
-                                - Strong alignment with industry standards
-                                - Effective communication of achievements
-                                """
-                            elif total_score >= 70:
-                                impact_assessment = """
-                                Your resume presents a **solid professional profile** with:
-                                
-                                • **Notable Strengths**
-                                - Good foundation for ATS compatibility
-                                - Clear presentation of professional experience
-                                - Adequate skill demonstration
-                                - Defined career progression
-                                """
-                            else:
-                                impact_assessment = """
-                                Your resume presents a **developing professional profile** with:
-                                
-                                • **Core Elements**
-                                - Basic professional presentation
-                                - Fundamental skill documentation
-                                - Career experience outline
-                                - Development opportunities identified
-                                """
-                            
-                            st.markdown(impact_assessment)
-                            
-                            # Market Readiness
-                            st.markdown("#### Market Readiness Assessment")
-                            st.markdown(f"""
-                            Based on the comprehensive analysis, your resume demonstrates:
-                            
-                            • **Overall Market Position**
-                            - {'Strong' if total_score >= 85 else 'Moderate' if total_score >= 70 else 'Basic'} competitive standing
-                            - {'Excellent' if total_score >= 85 else 'Good' if total_score >= 70 else 'Fair'} industry alignment
-                            - {'High' if total_score >= 85 else 'Moderate' if total_score >= 70 else 'Basic'} professional impact
-                            
-                            • **Technical Readiness**
-                            - {'Advanced' if st.session_state.parsed_resume['scores'].get('skills_score', 0) >= 85 else 'Intermediate' if st.session_state.parsed_resume['scores'].get('skills_score', 0) >= 70 else 'Basic'} technical proficiency
-                            - {'Strong' if st.session_state.parsed_resume['scores'].get('content_score', 0) >= 85 else 'Good' if st.session_state.parsed_resume['scores'].get('content_score', 0) >= 70 else 'Basic'} experience documentation
-                            - {'Excellent' if st.session_state.parsed_resume['scores'].get('keyword_score', 0) >= 85 else 'Good' if st.session_state.parsed_resume['scores'].get('keyword_score', 0) >= 70 else 'Basic'} keyword optimization
-                            """)
-                            
-                        else:
-                            st.warning("No analysis data available. Please ensure your resume has been properly analyzed.")
+                    st.session_state.ai_analysis = analysis
 
-                    with tab6:
-                        st.subheader("Interactive Resume Analysis Visualization")
-                        
-                        if 'scores' in st.session_state.parsed_resume:
-                            scores = st.session_state.parsed_resume['scores']
-                            
-                            # Create two columns for the visualizations
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                # Radar Chart for Overall Scores
-                                categories = ['Content', 'Skills', 'Keywords', 'Format', 'Readability']
-                                values = [
-                                    scores.get('content_score', 0),
-                                    scores.get('skills_score', 0),
-                                    scores.get('keyword_score', 0),
-                                    scores.get('format_score', 0),
-                                    scores.get('readability_score', 0)
-                                ]
-                                
-                                fig_radar = go.Figure()
-                                fig_radar.add_trace(go.Scatterpolar(
-                                    r=values,
-                                    theta=categories,
-                                    fill='toself',
-                                    name='Your Resume'
-                                ))
-                                
-                                fig_radar.update_layout(
-                                    polar=dict(
-                                        radialaxis=dict(
-                                            visible=True,
-                                            range=[0, 100]
-                                        )),
-                                    showlegend=False,
-                                    title="Resume Score Distribution"
-                                )
-                                
-                                st.plotly_chart(fig_radar, use_container_width=True)
-                            
-                            with col2:
-                                # Gauge chart for Overall ATS Score
-                                total_score = scores.get('total_score', 0)
-                                
-                                fig_gauge = go.Figure(go.Indicator(
-                                    mode = "gauge+number",
-                                    value = total_score,
-                                    domain = {'x': [0, 1], 'y': [0, 1]},
-                                    gauge = {
-                                        'axis': {'range': [0, 100]},
-                                        'bar': {'color': "darkblue"},
-                                        'steps': [
-                                            {'range': [0, 50], 'color': "lightgray"},
-                                            {'range': [50, 70], 'color': "gray"},
-                                            {'range': [70, 85], 'color': "lightblue"},
-                                            {'range': [85, 100], 'color': "royalblue"}
-                                        ],
-                                        'threshold': {
-                                            'line': {'color': "red", 'width': 4},
-                                            'thickness': 0.75,
-                                            'value': 85
-                                        }
-                                    },
-                                    title = {'text': "Overall ATS Score"}
-                                ))
-                                
-                                st.plotly_chart(fig_gauge, use_container_width=True)
-                            
-                            # Skills Distribution Chart
-                            if 'skills_data' in locals():
-                                # Prepare skills data
-                                skills_categories = list(skills_data.keys())
-                                skills_counts = [len(skills) for skills in skills_data.values()]
-                                
-                                # Create a donut chart
-                                fig_skills = go.Figure(data=[go.Pie(
-                                    labels=skills_categories,
-                                    values=skills_counts,
-                                    hole=.3,
-                                    textinfo='label+percent'
-                                )])
-                                
-                                fig_skills.update_layout(
-                                    title="Skills Distribution",
-                                    annotations=[dict(text='Skills', x=0.5, y=0.5, font_size=20, showarrow=False)]
-                                )
-                                
-                                st.plotly_chart(fig_skills, use_container_width=True)
-                            
-                            # Score Trends Bar Chart
-                            score_data = pd.DataFrame({
-                                'Category': ['Content Quality', 'Skills Coverage', 'Keyword Match', 'Format Score', 'Readability'],
-                                'Score': [
-                                    scores.get('content_score', 0),
-                                    scores.get('skills_score', 0),
-                                    scores.get('keyword_score', 0),
-                                    scores.get('format_score', 0),
-                                    scores.get('readability_score', 0)
-                                ],
-                                'Target': [90, 85, 80, 90, 85]
-                            })
-                            
-                            fig_bars = go.Figure()
-                            fig_bars.add_trace(go.Bar(
-                                name='Your Score',
-                                x=score_data['Category'],
-                                y=score_data['Score'],
-                                marker_color='royalblue'
-                            ))
-                            fig_bars.add_trace(go.Bar(
-                                name='Target Score',
-                                x=score_data['Category'],
-                                y=score_data['Target'],
-                                marker_color='lightgray'
-                            ))
-                            
-                            fig_bars.update_layout(
-                                title="Score Comparison with Targets",
-                                barmode='group',
-                                yaxis_title="Score (%)",
-                                xaxis_title="Categories"
-                            )
-                            
-                            st.plotly_chart(fig_bars, use_container_width=True)
-                            
-                            # Interactive Metrics Explorer
-                            st.subheader("Interactive Metrics Explorer")
-                            
-                            # Create selection for metrics
-                            selected_metrics = st.multiselect(
-                                "Select metrics to compare",
-                                ['Content Score', 'Skills Score', 'Keyword Score', 'Format Score', 'Readability Score'],
-                                default=['Content Score', 'Skills Score']
-                            )
-                            
-                            if selected_metrics:
-                                # Prepare data for selected metrics
-                                metric_values = {
-                                    'Content Score': scores.get('content_score', 0),
-                                    'Skills Score': scores.get('skills_score', 0),
-                                    'Keyword Score': scores.get('keyword_score', 0),
-                                    'Format Score': scores.get('format_score', 0),
-                                    'Readability Score': scores.get('readability_score', 0)
-                                }
-                                
-                                selected_data = {
-                                    metric: metric_values[metric]
-                                    for metric in selected_metrics
-                                }
-                                
-                                # Create comparison chart
-                                fig_compare = go.Figure()
-                                for metric, value in selected_data.items():
-                                    fig_compare.add_trace(go.Bar(
-                                        name=metric,
-                                        x=[metric],
-                                        y=[value],
-                                        text=[f"{value}%"],
-                                        textposition='auto',
-                                    ))
-                                
-                                fig_compare.update_layout(
-                                    title="Metrics Comparison",
-                                    yaxis_title="Score (%)",
-                                    yaxis_range=[0, 100],
-                                    showlegend=False
-                                )
-                                
-                                st.plotly_chart(fig_compare, use_container_width=True)
-                            
-                        else:
-                            st.warning("No analysis data available for visualization. Please ensure your resume has been properly analyzed.")
+                    render_analysis_tabs(analysis, parsed_data, "upload")
                 
         except Exception as e:
             st.error(f"An error occurred during AI analysis: {str(e)}")
             st.info("Please check your API key or try again later.")
 
+# Static Skills Analysis copy, emitted as-is by render_analysis_tabs
+LANGUAGES_ANALYSIS_MD = """
+**Analysis:**
+Your programming language portfolio shows a good mix of modern and established technologies.
+Consider focusing on deepening expertise in your core languages while maintaining working
+knowledge of others.
+"""
+
+FRAMEWORKS_ANALYSIS_MD = """
+**Framework Proficiency:**
+Your experience with these frameworks indicates a solid foundation in software development.
+This diverse knowledge base allows you to adapt to different project requirements and
+technical environments.
+"""
+
+SOFT_SKILLS_IMPACT_MD = """
+**Professional Impact:**
+Your soft skills complement your technical abilities, showing a well-rounded
+professional profile. These skills are particularly valuable for:
+• Team collaboration and leadership roles
+• Project management and coordination
+• Client interaction and communication
+"""
+
+TOOLS_ENVIRONMENT_MD = """
+**Technical Environment:**
+Your experience with these tools indicates familiarity with modern development
+practices and environments. This toolkit supports efficient development workflows
+and collaborative work.
+"""
+
+SKILLS_OUTLOOK_MD = """
+#### Key Observations
+
+1. **Technical Depth**
+   - Your technical skills show both breadth and depth
+   - Good balance between fundamental and specialized technologies
+   - Evidence of continuous learning and adaptation
+
+2. **Professional Development**
+   - Strong foundation in core development practices
+   - Demonstrated ability to work with modern tools
+   - Clear progression in skill acquisition
+
+3. **Areas of Excellence**
+   - Solid programming language foundation
+   - Practical experience with industry-standard tools
+   - Balance of technical and soft skills
+
+### Recommendations for Growth
+
+Based on your current skill set, consider:
+
+1. **Skill Enhancement**
+   - Deepen expertise in your primary programming languages
+   - Stay updated with the latest versions and features
+   - Practice through complex projects
+
+2. **Knowledge Expansion**
+   - Explore complementary technologies
+   - Focus on high-demand areas in your field
+   - Maintain awareness of industry trends
+
+3. **Professional Development**
+   - Seek opportunities to lead technical initiatives
+   - Share knowledge through mentoring or documentation
+   - Contribute to open-source projects
+"""
+
+# Executive Summary copy; the templates are filled with str.format
+OVERALL_ASSESSMENT_MD = """
+### Overall Assessment
+
+Your resume has been analyzed across multiple dimensions including content quality, 
+ATS compatibility, skills presentation, and overall professional impact. Here's a 
+comprehensive summary of the findings:
+"""
+
+KEY_METRICS_MD = """
+#### Key Performance Metrics
+
+Your resume achieved an overall score of **{total}%** with the following key observations:
+
+• **Content Strength**: {content}%
+- Measures the quality and relevance of your professional experience
+- Evaluates the impact and clarity of your achievements
+
+• **ATS Compatibility**: {keyword}%
+- Assesses how well your resume aligns with ATS systems
+- Evaluates keyword optimization and format compliance
+
+• **Skills Presentation**: {skills}%
+- Analyzes the breadth and depth of your technical capabilities
+- Evaluates how effectively skills are contextualized
+"""
+
+PROFILE_CHARACTERISTICS_MD = """
+#### Professional Profile Analysis
+
+Your professional profile demonstrates the following characteristics:
+
+• **Experience Presentation**
+- Career progression and achievements are effectively structured
+- Professional impact is quantified where applicable
+- Key responsibilities align with industry expectations
+
+• **Technical Expertise**
+- Demonstrates proficiency in relevant technical domains
+- Shows adaptability across different technologies
+- Highlights practical application of skills
+
+• **Professional Development**
+- Shows continuous learning and skill advancement
+- Indicates ability to adapt to industry changes
+- Demonstrates professional growth trajectory
+"""
+
+SKILLS_DISTRIBUTION_MD = """
+#### Skills Distribution
+
+Your skill set demonstrates the following distribution:
+
+• **Technical Competencies**
+- Programming Languages: Core and supplementary technologies
+- Frameworks & Tools: Industry-standard development tools
+- Technical Methodologies: Development and deployment practices
+
+• **Professional Capabilities**
+- Project Management: Planning and execution abilities
+- Team Collaboration: Communication and leadership skills
+- Problem Solving: Analytical and strategic thinking
+"""
+
+# Overall impact paragraphs for strong (85+), solid (70+) and developing profiles
+IMPACT_ASSESSMENT_MD = (
+    """
+Your resume presents a **strong professional profile** with:
+
+• **Exceptional Qualities**
+- Well-optimized for ATS systems
+- Clear demonstration of professional expertise
+- Strong alignment with industry standards
+- Effective communication of achievements
+""",
+    """
+Your resume presents a **solid professional profile** with:
+
+• **Notable Strengths**
+- Good foundation for ATS compatibility
+- Clear presentation of professional experience
+- Adequate skill demonstration
+- Defined career progression
+""",
+    """
+Your resume presents a **developing professional profile** with:
+
+• **Core Elements**
+- Basic professional presentation
+- Fundamental skill documentation
+- Career experience outline
+- Development opportunities identified
+"""
+)
+
+MARKET_READINESS_MD = """
+#### Market Readiness Assessment
+
+Based on the comprehensive analysis, your resume demonstrates:
+
+• **Overall Market Position**
+- {position} competitive standing
+- {alignment} industry alignment
+- {impact} professional impact
+
+• **Technical Readiness**
+- {proficiency} technical proficiency
+- {documentation} experience documentation
+- {optimization} keyword optimization
+"""
+
+def _score_band(score, labels):
+    """Pick the label for a strong (85+), middling (70+) or basic score"""
+    high, middle, low = labels
+    return high if score >= 85 else middle if score >= 70 else low
+
+# ATS score components as (label, score key, maximum points)
+SCORE_COMPONENTS = [
+    ('Format & Structure', 'format_score', 15),
+    ('Content Quality', 'content_score', 25),
+    ('Skills Coverage', 'skills_score', 25),
+    ('Keyword Match', 'keyword_score', 25),
+    ('Readability', 'readability_score', 10)
+]
+
+# Headline ATS metrics as (label, score key, target percentage)
+ATS_METRICS = [
+    ("Overall ATS Score", 'total_score', 85),
+    ("Keyword Match", 'keyword_score', 80),
+    ("Format Score", 'format_score', 90)
+]
+
+# plotly is only needed by the Visualization tab, so it is imported on first use
+# rather than at startup
+go = None
+
+def _go():
+    """Return plotly.graph_objects, importing it on first call"""
+    global go
+    if go is None:
+        go = import_module("plotly.graph_objects")
+    return go
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_radar(values):
+    """Radar chart of the five score components"""
+    go = _go()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(values),
+        theta=['Content', 'Skills', 'Keywords', 'Format', 'Readability'],
+        fill='toself',
+        name='Your Resume'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=False,
+        title="Resume Score Distribution"
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_gauge(total_score):
+    """Gauge chart for the overall ATS score"""
+    go = _go()
+    
+    return go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = total_score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 70], 'color': "gray"},
+                {'range': [70, 85], 'color': "lightblue"},
+                {'range': [85, 100], 'color': "royalblue"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 85
+            }
+        },
+        title = {'text': "Overall ATS Score"}
+    ))
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_skills_donut(skill_counts):
+    """Donut chart of skills per category, from (category, count) pairs"""
+    go = _go()
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=[category for category, _ in skill_counts],
+        values=[count for _, count in skill_counts],
+        hole=.3,
+        textinfo='label+percent'
+    )])
+    
+    fig.update_layout(
+        title="Skills Distribution",
+        annotations=[dict(text='Skills', x=0.5, y=0.5, font_size=20, showarrow=False)]
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_score_bars(values):
+    """Grouped bar chart comparing the score components against targets"""
+    go = _go()
+    
+    categories = ['Content Quality', 'Skills Coverage', 'Keyword Match', 'Format Score', 'Readability']
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Your Score',
+        x=categories,
+        y=list(values),
+        marker_color='royalblue'
+    ))
+    fig.add_trace(go.Bar(
+        name='Target Score',
+        x=categories,
+        y=(90, 85, 80, 90, 85),
+        marker_color='lightgray'
+    ))
+    
+    fig.update_layout(
+        title="Score Comparison with Targets",
+        barmode='group',
+        yaxis_title="Score (%)",
+        xaxis_title="Categories"
+    )
+    return fig
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _build_metrics_compare(selected_data):
+    """Bar chart of the metrics picked in the explorer, from (metric, value) pairs"""
+    go = _go()
+    
+    labels = [metric for metric, _ in selected_data]
+    vals = [value for _, value in selected_data]
+    
+    fig = go.Figure(go.Bar(
+        x=labels,
+        y=vals,
+        text=[f"{value}%" for value in vals],
+        textposition='auto',
+    ))
+    
+    fig.update_layout(
+        title="Metrics Comparison",
+        yaxis_title="Score (%)",
+        yaxis_range=[0, 100],
+        showlegend=False
+    )
+    return fig
+
+@st.fragment
+def render_visualizations(scores, skills_data, key_prefix):
+    """Render the Visualization tab's charts
+    
+    Runs as its own fragment so the metrics explorer only reruns this tab.
+    key_prefix keeps the element keys apart when both the upload and the
+    preview analysis are on the page.
+    """
+    # Five component scores in the order the radar and bar charts expect
+    values = tuple(scores.get(key, 0) for key in (
+        'content_score', 'skills_score', 'keyword_score', 'format_score', 'readability_score'
+    ))
+    
+    # Create two columns for the visualizations
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(_build_radar(values), use_container_width=True, key=f"{key_prefix}_radar")
+    
+    with col2:
+        total_score = scores.get('total_score', 0)
+        st.plotly_chart(_build_gauge(total_score), use_container_width=True, key=f"{key_prefix}_gauge")
+    
+    # Skills Distribution Chart
+    if skills_data is not None:
+        skill_counts = tuple((category, len(skills)) for category, skills in skills_data.items())
+        st.plotly_chart(_build_skills_donut(skill_counts), use_container_width=True, key=f"{key_prefix}_skills")
+    
+    # Score Trends Bar Chart
+    st.plotly_chart(_build_score_bars(values), use_container_width=True, key=f"{key_prefix}_bars")
+    
+    # Interactive Metrics Explorer
+    st.subheader("Interactive Metrics Explorer")
+    
+    # Create selection for metrics
+    selected_metrics = st.multiselect(
+        "Select metrics to compare",
+        ['Content Score', 'Skills Score', 'Keyword Score', 'Format Score', 'Readability Score'],
+        default=['Content Score', 'Skills Score'],
+        key=f"{key_prefix}_metrics"
+    )
+    
+    if selected_metrics:
+        # Prepare data for selected metrics
+        metric_values = dict(zip(
+            ['Content Score', 'Skills Score', 'Keyword Score', 'Format Score', 'Readability Score'],
+            values
+        ))
+        
+        selected_data = tuple(
+            (metric, metric_values[metric])
+            for metric in selected_metrics
+        )
+        
+        st.plotly_chart(_build_metrics_compare(selected_data), use_container_width=True, key=f"{key_prefix}_compare")
+
+@st.fragment
+def render_analysis_tabs(analysis, parsed_data, key_prefix):
+    """Render the AI analysis tabs for an uploaded ("upload") or generated ("preview") resume"""
+    # Imported here so the form and upload screens don't pay for pandas
+    import pandas as pd
+    
+    scores = parsed_data['scores']
+    # Filled in by the Skills tab and reused by the Summary and Visualization tabs
+    skills_data = None
+    
+    # Create tabs for different analysis sections
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "ATS Score", 
+        "Profile Analysis",
+        "Skills Analysis",
+        "Optimization",
+        "Summary Report",
+        "Visualization"
+    ])
+    
+    with tab1:
+        st.subheader("ATS Compatibility Score")
+        
+        # Overall ATS Score at the top
+        total_score = scores['total_score']
+        st.markdown(f"""
+        <div class='ats-score-container'>
+            <h2>Overall ATS Score: {total_score}%</h2>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Create a DataFrame for the score breakdown
+        breakdown = [(label, max_points, scores[key]) for label, key, max_points in SCORE_COMPONENTS]
+        score_breakdown = pd.DataFrame(breakdown, columns=['Component', 'Maximum Points', 'Your Score'])
+        
+        # Display the score breakdown as a styled table
+        st.markdown("### Score Breakdown")
+        st.dataframe(
+            score_breakdown.style
+            .set_properties(**{'text-align': 'left'})
+            .bar(subset=['Your Score'], color='#0068c9', vmin=0, vmax=25)
+            .format({'Maximum Points': '{:.0f}', 'Your Score': '{:.1f}'}),
+            use_container_width=True
+        )
+        
+        # Display individual score components with progress bars
+        st.markdown("### Detailed Component Analysis")
+        for component, max_points, score in breakdown:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                progress = (score / max_points) * 100
+                st.markdown(f"**{component}**")
+                st.progress(progress / 100)
+            with col2:
+                st.markdown(f"**{score:.1f}/{max_points:.0f}**")
+            st.markdown("---")
+        
+        # Add score interpretation
+        st.markdown("### Score Interpretation")
+        if total_score >= 85:
+            st.success("Your resume is well-optimized for ATS systems! 🌟")
+        elif total_score >= 70:
+            st.warning("Your resume meets basic ATS requirements but has room for improvement. 📈")
+        else:
+            st.error("Your resume needs significant optimization for better ATS performance. 🎯")
+    
+    with tab2:
+        st.markdown(f"### Profile Analysis\n\n{analysis['profile_analysis']}")
+    
+    with tab3:
+        st.subheader("Skills Analysis")
+        try:
+            # Get skills data based on the source (uploaded or generated)
+            skills_data = {}
+            
+            if 'parsed_resume' in st.session_state and st.session_state.parsed_resume:
+                # For uploaded resumes
+                detected = st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {})
+                skills_data = {
+                    'programming_languages': detected.get('programming_languages', []),
+                    'frameworks_libraries': detected.get('frameworks_libraries', []),
+                    'soft_skills': detected.get('soft_skills', []),
+                    'tools_technologies': detected.get('tools_technologies', [])
+                }
+            elif 'resume_data' in st.session_state and st.session_state.resume_data:
+                # For generated resumes
+                skills = st.session_state.resume_data.get('skills', {})
+                skills_data = {
+                    'programming_languages': skills.get('programming', []),
+                    'frameworks_libraries': skills.get('frameworks', []),
+                    'soft_skills': skills.get('soft_skills', []),
+                    'tools_technologies': skills.get('tools', [])
+                }
+                
+                # Clean up empty strings from lists
+                for category in skills_data:
+                    skills_data[category] = _strip_items(skills_data[category])
+
+            if not any(skills_data.values()):
+                st.warning("No skills data available. Please ensure your resume includes skills information.")
+                return
+
+            # Technical Skills Analysis
+            st.markdown("### Technical Skills Analysis")
+            
+            # Programming Languages
+            if skills_data.get('programming_languages'):
+                st.markdown("""
+                #### Programming Languages
+                Your resume demonstrates proficiency in multiple programming languages. Here's a detailed analysis:
+                """)
+                
+                langs = sorted(skills_data['programming_languages'])
+                st.markdown("\n\n".join(["**Core Languages:**"] + [
+                    f"• `{lang}` - Demonstrated through projects and experience" for lang in langs[:3]
+                ]))
+                
+                if len(langs) > 3:
+                    st.markdown("\n\n".join(["**Additional Languages:**"] + [f"• `{lang}`" for lang in langs[3:]]))
+                
+                st.markdown(LANGUAGES_ANALYSIS_MD)
+
+            # Frameworks and Libraries
+            if skills_data.get('frameworks_libraries'):
+                st.markdown("""
+                #### Frameworks & Libraries
+                Your technical stack includes various frameworks and libraries:
+                """)
+                
+                frameworks = sorted(skills_data['frameworks_libraries'])
+                st.markdown("\n\n".join(f"• `{fw}`" for fw in frameworks))
+                
+                st.markdown(FRAMEWORKS_ANALYSIS_MD)
+
+            # Professional Skills Analysis
+            st.markdown("### Professional Skills Analysis")
+            
+            if skills_data.get('soft_skills'):
+                st.markdown("""
+                #### Soft Skills & Professional Competencies
+                Your resume demonstrates the following professional capabilities:
+                """)
+                
+                soft_skills = sorted(skills_data['soft_skills'])
+                st.markdown("\n\n".join(f"• {skill}" for skill in soft_skills))
+                
+                st.markdown(SOFT_SKILLS_IMPACT_MD)
+
+            # Tools and Technologies
+            if skills_data.get('tools_technologies'):
+                st.markdown("""
+                #### Tools & Technologies
+                Your proficiency extends to various development tools and technologies:
+                """)
+                
+                tools = sorted(skills_data['tools_technologies'])
+                st.markdown("\n\n".join(f"• `{tool}`" for tool in tools))
+                
+                st.markdown(TOOLS_ENVIRONMENT_MD)
+
+            # Overall Skills Assessment
+            st.markdown("### Overall Skills Assessment")
+            
+            # Calculate total skills and distributions
+            skill_counts = {category: len(skills) for category, skills in skills_data.items() if skills}
+            total_skills = sum(skill_counts.values())
+            
+            st.markdown(f"""
+            #### Comprehensive Analysis
+            
+            Your skill profile includes {total_skills} distinct competencies across various categories.
+            The distribution shows:
+            """)
+            
+            st.markdown("\n\n".join(
+                f"• **{category.replace('_', ' ').title()}**: {count} skills ({count / total_skills * 100:.1f}%)"
+                for category, count in skill_counts.items()
+            ))
+            
+            st.markdown(SKILLS_OUTLOOK_MD)
+
+        except Exception as e:
+            st.error(f"An error occurred in skills analysis: {str(e)}")
+            st.info("Please ensure your resume includes skills information and try again.")
+    
+    with tab4:
+        st.subheader("ATS Analysis")
+        
+        if 'scores' in st.session_state.parsed_resume:
+            scores = st.session_state.parsed_resume['scores']
+            
+            # Core ATS Analysis
+            st.markdown("### ATS Score Overview")
+            
+            # Display scores in a clean layout
+            for col, (label, key, target) in zip(st.columns(3), ATS_METRICS):
+                value = scores.get(key, 0)
+                col.metric(
+                    label,
+                    f"{value}%",
+                    delta=f"Target: {target}%+" if value < target else None,
+                    delta_color="inverse"
+                )
+                
+            # Quick Summary
+            total_score = scores.get('total_score', 0)
+            if total_score >= 85:
+                st.success("Your resume is well-optimized for ATS systems.")
+            elif total_score >= 70:
+                st.warning("Your resume meets basic ATS requirements but has room for improvement.")
+            else:
+                st.error("Your resume may need optimization for better ATS performance.")
+            
+        else:
+            st.warning("No ATS analysis data available. Please ensure your resume has been properly analyzed.")
+        
+        st.markdown(analysis['ats_analysis'])
+        
+    with tab5:
+        st.subheader("Executive Summary Report")
+        
+        if 'scores' in st.session_state.parsed_resume:
+            summary_scores = st.session_state.parsed_resume['scores']
+            total_score = summary_scores.get('total_score', 0)
+            content_score = summary_scores.get('content_score', 0)
+            keyword_score = summary_scores.get('keyword_score', 0)
+            skills_score = summary_scores.get('skills_score', 0)
+            
+            # Assemble the whole report and emit it as a single markdown element
+            parts = [
+                OVERALL_ASSESSMENT_MD,
+                KEY_METRICS_MD.format(
+                    total=total_score,
+                    content=content_score,
+                    keyword=keyword_score,
+                    skills=skills_score
+                ),
+                PROFILE_CHARACTERISTICS_MD
+            ]
+            
+            # Skills Distribution
+            if skills_data is not None:
+                parts.append(SKILLS_DISTRIBUTION_MD)
+            
+            # Overall Impact
+            parts += ["#### Overall Professional Impact", _score_band(total_score, IMPACT_ASSESSMENT_MD)]
+            
+            # Market Readiness
+            parts.append(MARKET_READINESS_MD.format(
+                position=_score_band(total_score, ('Strong', 'Moderate', 'Basic')),
+                alignment=_score_band(total_score, ('Excellent', 'Good', 'Fair')),
+                impact=_score_band(total_score, ('High', 'Moderate', 'Basic')),
+                proficiency=_score_band(skills_score, ('Advanced', 'Intermediate', 'Basic')),
+                documentation=_score_band(content_score, ('Strong', 'Good', 'Basic')),
+                optimization=_score_band(keyword_score, ('Excellent', 'Good', 'Basic'))
+            ))
+            
+            st.markdown("\n\n".join(parts))
+            
+        else:
+            st.warning("No analysis data available. Please ensure your resume has been properly analyzed.")
+
+    with tab6:
+        st.subheader("Interactive Resume Analysis Visualization")
+        
+        if 'scores' in st.session_state.parsed_resume:
+            render_visualizations(st.session_state.parsed_resume['scores'], skills_data, key_prefix)
+            
+        else:
+            st.warning("No analysis data available for visualization. Please ensure your resume has been properly analyzed.")
+
 def main():
     """Main application function"""
     initialize_session_state()
-    initialize_ai()
-    load_css()
+    model = initialize_ai()
     
     # Header
-    st.markdown(""" <div class="header">
-        <div class="header-content">
-            <h1 class="header-title">R.E.A.D.M.L.</h1>
-            <h2 class="header-subtitle">Resume Enhancing, Analyzing & Developing using Machine Learning</h2>
-            <div class="header-divider"></div>
-            <div class="header-description">
-                    Elevate your resume with AI-powered optimization. Our intelligent system crafts professional, 
-    ATS-friendly resumes while providing smart suggestions to make your experience stand out.
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     # Add tabs for different features
     tab1, tab2 = st.tabs(["Create New Resume", "Analyze Existing Resume"])
@@ -912,112 +1089,111 @@ def main():
             with st.expander("Fill the Resume Details", expanded=True):
                 # First Form (Personal Info, Education, Profile, Skills)
                 with st.form("resume_form"):
+                    fd = st.session_state.form_data
+                    pi = fd['personal_info']
+                    ed = fd['education']
+                    ps = fd['profile_summary']
+                    sk = fd['skills']
+                    projects = st.session_state.projects
+                    
                     # Personal Information
                     st.markdown("### Personal Information")
+                    # One two-column layout; each row fills the left then the right column
                     col1, col2 = st.columns(2)
                     full_name = col1.text_input("Full Name*", placeholder="Enter your full name", 
-                                               value=st.session_state.form_data['personal_info'].get('name', ''))
+                                               value=pi.get('name', ''))
                     email = col2.text_input("Email*", placeholder="Enter your email address", 
-                                          value=st.session_state.form_data['personal_info'].get('email', ''))
-                    
-                    col1, col2 = st.columns(2)
+                                          value=pi.get('email', ''))
                     phone = col1.text_input("Phone*", placeholder="Enter your phone number", 
-                                          value=st.session_state.form_data['personal_info'].get('phone', ''))
+                                          value=pi.get('phone', ''))
                     linkedin = col2.text_input("LinkedIn", placeholder="Enter your LinkedIn profile URL", 
-                                             value=st.session_state.form_data['personal_info'].get('linkedin', ''))
-                    col1, col2 = st.columns(2)
+                                             value=pi.get('linkedin', ''))
                     github = col1.text_input("GitHub", placeholder="Enter your GitHub profile URL", 
-                                           value=st.session_state.form_data['personal_info'].get('github', ''))
+                                           value=pi.get('github', ''))
                     location = col2.text_input("Current Location*", placeholder="Enter your current location (e.g., City, State)", 
-                                           value=st.session_state.form_data['personal_info'].get('location', ''))
+                                           value=pi.get('location', ''))
                     
                     # Education
                     st.markdown("### Education")
                     university = st.text_input("University*", placeholder="Enter your university name", 
-                                             value=st.session_state.form_data['education'].get('university', ''))
+                                             value=ed.get('university', ''))
                     degree = st.text_input("Degree in*", placeholder="Enter your degree and major", 
-                                         value=st.session_state.form_data['education'].get('degree', ''))
+                                         value=ed.get('degree', ''))
                     
                     # Handle graduation date input
-                    grad_date = st.session_state.form_data['education'].get('graduation_date')
-                    if grad_date:
+                    grad_date = ed.get('graduation_date')
+                    if isinstance(grad_date, str):
                         try:
-                            if isinstance(grad_date, str):
-                                grad_date = datetime.strptime(grad_date, "%B %Y")
+                            grad_date = datetime.strptime(grad_date, "%B %Y")
                         except ValueError:
-                            grad_date = datetime.now()
-                    else:
+                            grad_date = None
+                    if not grad_date:
                         grad_date = datetime.now()
                         
                     graduation_date = st.date_input("Expected Graduation*", value=grad_date)
                     gpa = st.text_input("CGPA/GPA", placeholder="Enter your GPA (e.g., 3.8)", 
-                                      value=st.session_state.form_data['education'].get('gpa', ''))
+                                      value=ed.get('gpa', ''))
                     
                     # Profile Summary
                     st.markdown("### Profile Summary")
                     target_role = st.text_input("Target Role*", placeholder="Enter your target role", 
-                                              value=st.session_state.form_data['profile_summary'].get('target_role', ''))
+                                              value=ps.get('target_role', ''))
                     profile_summary = st.text_area("Summary*", 
                         placeholder="Enter your professional background and career goals in bullet points:\n- First point\n- Second point\n- Third point", 
                         height=200,
-                        value=st.session_state.form_data['profile_summary'].get('summary', ''))
+                        value=ps.get('summary', ''))
                     
                     # Skills
                     st.markdown("### Skills")
                     programming_skills = st.text_input("Programming Skills (comma separated)*", 
                         placeholder="List your programming languages (e.g., Python, Java, JavaScript)",
-                        value=", ".join(st.session_state.form_data['skills'].get('programming', [])))
+                        value=_list_to_csv(sk.get('programming', [])))
                     soft_skills = st.text_input("Soft Skills (comma separated)", 
                         placeholder="List your soft skills (e.g., Leadership, Communication, Team Management)",
-                        value=", ".join(st.session_state.form_data['skills'].get('soft_skills', [])))
+                        value=_list_to_csv(sk.get('soft_skills', [])))
                     frameworks = st.text_input("Library / Frameworks (comma separated)", 
                         placeholder="List your frameworks and libraries (e.g., React, Node.js, TensorFlow)",
-                        value=", ".join(st.session_state.form_data['skills'].get('frameworks', [])))
+                        value=_list_to_csv(sk.get('frameworks', [])))
                     other_skills = st.text_input("Other Skills (comma separated)", 
                         placeholder="List your other relevant skills (e.g., Agile, System Design)",
-                        value=", ".join(st.session_state.form_data['skills'].get('other', [])))
+                        value=_list_to_csv(sk.get('other', [])))
                     tools = st.text_input("Tools (comma separated)", 
                         placeholder="List the tools and technologies you use (e.g., Git, Docker, VS Code)",
-                        value=", ".join(st.session_state.form_data['skills'].get('tools', [])))
+                        value=_list_to_csv(sk.get('tools', [])))
                     
                     # Projects Section
                     st.markdown("### Projects")
-                    for i, project in enumerate(st.session_state.projects):
-                        st.markdown(f"#### Project {i+1}")
-                        project['title'] = st.text_input(
-                            f"Project {i+1} Title*", 
-                            value=project.get('title', ''),
-                            placeholder="Enter project title",
-                            key=f"title_{i}")
-                        project['duration'] = st.text_input(
-                            f"Project {i+1} Duration*", 
-                            value=project.get('duration', ''),
-                            placeholder="Enter project duration (e.g., Jan 2023 - Present)",
-                            key=f"duration_{i}")
-                        project['tools'] = st.text_input(
-                            f"Project {i+1} Tools*", 
-                            value=project.get('tools', ''),
-                            placeholder="List technologies used (e.g., React, Node.js, MongoDB)",
-                            key=f"tools_{i}")
-                        project['description'] = st.text_area(
-                            f"Project {i+1} Description*", 
-                            value=project.get('description', ''),
-                            placeholder="Describe your project's purpose and key features...",
-                            height=150,
-                            key=f"desc_{i}")
-                        project['responsibilities'] = st.text_area(
-                            f"Project {i+1} Responsibilities*", 
-                            value=project.get('responsibilities', ''),
+                    for i, project in enumerate(projects):
+                        prefix = f"Project {i+1}"
+                        st.markdown(f"#### {prefix}")
+                        for field, label, key_prefix, placeholder, height in PROJECT_WIDGETS:
+                            if height:
+                                project[field] = st.text_area(
+                                    f"{prefix} {label}*", 
+                                    value=project.get(field, ''),
+                                    placeholder=placeholder,
+                                    height=height,
+                                    key=f"{key_prefix}{i}")
+                            else:
+                                project[field] = st.text_input(
+                                    f"{prefix} {label}*", 
+                                    value=project.get(field, ''),
+                                    placeholder=placeholder,
+                                    key=f"{key_prefix}{i}")
+                        responsibilities = st.text_area(
+                            f"{prefix} Responsibilities*", 
+                            value=_list_to_lines(project.get('responsibilities', [])),
                             placeholder="List your key responsibilities and achievements:\n- Responsibility 1\n- Responsibility 2",
                             height=200,
                             key=f"resp_{i}")
+                        project['responsibilities'] = _lines_to_list(responsibilities, project.get('responsibilities'))
                         
-                        if i < len(st.session_state.projects) - 1:
+                        if i < len(projects) - 1:
                             st.markdown("---")
                     
                     # Achievements
                     st.markdown("### Academic Achievements")
-                    achievements = st.session_state.form_data.get('achievements', [])
+                    achievements = fd.get('achievements', [])
                     achievement1 = st.text_input("Achievement 1", 
                         value=achievements[0] if len(achievements) > 0 else '',
                         placeholder="Enter your academic achievement (e.g., Dean's List, Scholarships)")
@@ -1028,21 +1204,20 @@ def main():
                     # Project management buttons inside form
                     button_cols = st.columns([1, 1])
                     add_clicked = button_cols[0].form_submit_button("Add Project")
-                    if len(st.session_state.projects) > 1:
-                        remove_clicked = button_cols[1].form_submit_button("Remove Project")
+                    remove_clicked = len(projects) > 1 and button_cols[1].form_submit_button("Remove Project")
 
                     if add_clicked:
-                        st.session_state.projects.append({
+                        projects.append({
                             'title': '',
                             'duration': '',
                             'tools': '',
                             'description': '',
-                            'responsibilities': ''
+                            'responsibilities': []
                         })
                         st.rerun()
 
-                    if len(st.session_state.projects) > 1 and 'remove_clicked' in locals() and remove_clicked:
-                        st.session_state.projects.pop()
+                    if remove_clicked:
+                        projects.pop()
                         st.rerun()
 
                     # Generate Resume button in center
@@ -1072,11 +1247,11 @@ def main():
                                 "summary": profile_summary
                             },
                             "skills": {
-                                "programming": [s.strip() for s in programming_skills.split(",")],
-                                "soft_skills": [s.strip() for s in soft_skills.split(",")] if soft_skills else [],
-                                "frameworks": [s.strip() for s in frameworks.split(",")] if frameworks else [],
-                                "other": [s.strip() for s in other_skills.split(",")] if other_skills else [],
-                                "tools": [s.strip() for s in tools.split(",")] if tools else []
+                                "programming": _csv_to_list(programming_skills, sk.get('programming')),
+                                "soft_skills": _csv_to_list(soft_skills, sk.get('soft_skills')),
+                                "frameworks": _csv_to_list(frameworks, sk.get('frameworks')),
+                                "other": _csv_to_list(other_skills, sk.get('other')),
+                                "tools": _csv_to_list(tools, sk.get('tools'))
                             },
                             "achievements": [
                                 achievement1,
@@ -1085,7 +1260,7 @@ def main():
                         }
                         
                         # Validate form
-                        errors = validate_form(form_data, st.session_state.projects)
+                        errors = validate_form(form_data, projects)
                         if errors:
                             for error in errors:
                                 st.error(error)
@@ -1101,34 +1276,31 @@ def main():
                                         "duration": project['duration'],
                                         "tools": project['tools'],
                                         "description": project['description'],
-                                        "responsibilities": project['responsibilities'].split("\n")
+                                        "responsibilities": project['responsibilities']
                                     }
-                                    for project in st.session_state.projects
+                                    for project in projects
                                 ]
                             }
                             
                             # Store in session state
                             st.session_state.resume_data = resume_data
+                            resume_key = resume_cache_key(resume_data)
+                            st.session_state.resume_key = resume_key
                             st.session_state.show_preview = True  # Flag to show preview section
 
                             # Calculate scores and perform analysis
                             try:
                                 # Calculate ATS score
-                                st.session_state.parsed_resume['scores'] = st.session_state.resume_parser.calculate_ats_score(
+                                st.session_state.parsed_resume['scores'] = get_resume_parser().calculate_ats_score(
                                     str(resume_data),  # Convert resume data to string for analysis
                                     resume_data.get('profile_summary', {}).get('target_role', '')  # Use target role as job description
                                 )
                                 
                                 # Get AI analysis
-                                analysis = analyze_resume_content(st.session_state.gemini_model, resume_data)
-                                ats_analysis = get_ats_optimization(st.session_state.gemini_model, resume_data)
+                                analysis = get_resume_analysis(model, resume_data, resume_key)
                                 
                                 # Store analysis in session state
-                                st.session_state.ai_analysis = {
-                                    'profile_analysis': analysis['profile_analysis'],
-                                    'skills_analysis': analysis['skills_analysis'],
-                                    'ats_analysis': ats_analysis['ats_analysis']
-                                }
+                                st.session_state.ai_analysis = analysis
                                 
                                 # Update detected skills
                                 st.session_state.parsed_resume['scores']['detected_skills'] = {
@@ -1143,688 +1315,44 @@ def main():
 
     with tab2:
         # New resume upload and analysis section
-        render_resume_upload_section()
+        render_resume_upload_section(model)
 
     # Preview and Download section (outside form)
-    if st.session_state.get('show_preview', False):
-        try:
-            with st.spinner("Generating your resume..."):
-                # Generate HTML resume
-                html_resume = generate_resume(st.session_state.resume_data)
+    resume_data = st.session_state.resume_data
+    if st.session_state.get('show_preview', False) and resume_data:
+        resume_key = st.session_state.resume_key
+        candidate_name = resume_data.get('personal_info', {}).get('name', '')
+        with st.spinner("Generating your resume..."):
+            # Generate HTML resume and PDF (cached per distinct resume data)
+            try:
+                st.session_state.pdf_bytes = build_pdf(resume_key, resume_data)
                 
-                # Create PDF
-                try:
-                    # Clean up old PDF if it exists
-                    if st.session_state.pdf_path and os.path.exists(st.session_state.pdf_path):
-                        try:
-                            os.remove(st.session_state.pdf_path)
-                        except:
-                            pass
-                            
-                    pdf_path = create_pdf(html_resume, st.session_state.resume_data["personal_info"]["name"])
-                    st.session_state.pdf_path = pdf_path
+                # Download button (outside form)
+                st.download_button(
+                    label="Download PDF",
+                    data=st.session_state.pdf_bytes,
+                    file_name=f"{candidate_name.replace(' ', '_')}_Resume.pdf",
+                    mime="application/pdf",
+                    key="download_resume_pdf"
+                )
+            except Exception as e:
+                st.error(f"Error generating PDF: {str(e)}")
+            
+        # AI Analysis Section (after resume generation)
+        with st.expander("AI Resume Analysis", expanded=True):
+            try:
+                with st.spinner("Analyzing your resume with AI..."):
+                    # Get AI analysis
+                    analysis = get_resume_analysis(model, resume_data, resume_key)
                     
-                    # Download button (outside form)
-                    if os.path.exists(st.session_state.pdf_path):
-                        with open(st.session_state.pdf_path, "rb") as f:
-                            pdf_data = f.read()
-                            st.download_button(
-                                label="Download PDF",
-                                data=pdf_data,
-                                file_name=f"{st.session_state.resume_data['personal_info']['name'].replace(' ', '_')}_Resume.pdf",
-                                mime="application/pdf"
-                            )
-                    else:
-                        st.error("PDF file was not created successfully. Please try again.")
-                except Exception as e:
-                    st.error(f"Error generating PDF: {str(e)}")
-                
-            # AI Analysis Section (after resume generation)
-            if st.session_state.get('show_preview', False) and st.session_state.resume_data:
-                with st.expander("AI Resume Analysis", expanded=True):
-                    try:
-                        with st.spinner("Analyzing your resume with AI..."):
-                            # Get AI analysis
-                            analysis = analyze_resume_content(st.session_state.gemini_model, st.session_state.resume_data)
-                            ats_analysis = get_ats_optimization(st.session_state.gemini_model, st.session_state.resume_data)
-                            
-                            # Store analysis in session state for later use
-                            st.session_state.ai_analysis = {
-                                'profile_analysis': analysis['profile_analysis'],
-                                'skills_analysis': analysis['skills_analysis'],
-                                'ats_analysis': ats_analysis['ats_analysis']
-                            }
-                            
-                            # Create tabs for different analysis sections
-                            tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-                                "ATS Score", 
-                                "Profile Analysis",
-                                "Skills Analysis",
-                                "Optimization",
-                                "Summary Report",
-                                "Visualization"
-                            ])
-                            
-                            with tab1:
-                                st.subheader("ATS Compatibility Score")
-                                
-                                # Overall ATS Score at the top
-                                total_score = st.session_state.parsed_resume['scores']['total_score']
-                                st.markdown(f"""
-                                <div class='ats-score-container'>
-                                    <h2>Overall ATS Score: {total_score}%</h2>
-                                </div>
-                                """, unsafe_allow_html=True)
-                                
-                                # Create a DataFrame for the score breakdown
-                                score_breakdown = pd.DataFrame({
-                                    'Component': [
-                                        'Format & Structure',
-                                        'Content Quality',
-                                        'Skills Coverage',
-                                        'Keyword Match',
-                                        'Readability'
-                                    ],
-                                    'Maximum Points': [15, 25, 25, 25, 10],
-                                    'Your Score': [
-                                        st.session_state.parsed_resume['scores']['format_score'],
-                                        st.session_state.parsed_resume['scores']['content_score'],
-                                        st.session_state.parsed_resume['scores']['skills_score'],
-                                        st.session_state.parsed_resume['scores']['keyword_score'],
-                                        st.session_state.parsed_resume['scores']['readability_score']
-                                    ]
-                                })
-                                
-                                # Display the score breakdown as a styled table
-                                st.markdown("### Score Breakdown")
-                                st.dataframe(
-                                    score_breakdown.style
-                                    .set_properties(**{'text-align': 'left'})
-                                    .bar(subset=['Your Score'], color='#0068c9', vmin=0, vmax=25)
-                                    .format({'Maximum Points': '{:.0f}', 'Your Score': '{:.1f}'}),
-                                    use_container_width=True
-                                )
-                                
-                                # Display individual score components with progress bars
-                                st.markdown("### Detailed Component Analysis")
-                                for _, row in score_breakdown.iterrows():
-                                    col1, col2 = st.columns([3, 1])
-                                    with col1:
-                                        progress = (row['Your Score'] / row['Maximum Points']) * 100
-                                        st.markdown(f"**{row['Component']}**")
-                                        st.progress(progress / 100)
-                                    with col2:
-                                        st.markdown(f"**{row['Your Score']:.1f}/{row['Maximum Points']:.0f}**")
-                                    st.markdown("---")
-                                
-                                # Add score interpretation
-                                st.markdown("### Score Interpretation")
-                                if total_score >= 85:
-                                    st.success("Your resume is well-optimized for ATS systems! 🌟")
-                                elif total_score >= 70:
-                                    st.warning("Your resume meets basic ATS requirements but has room for improvement. 📈")
-                                else:
-                                    st.error("Your resume needs significant optimization for better ATS performance. 🎯")
-                            
-                            with tab2:
-                                st.subheader("Profile Analysis")
-                                st.markdown(analysis['profile_analysis'])
-                            
-                            with tab3:
-                                st.subheader("Skills Analysis")
-                                try:
-                                    # Get skills data based on the source (uploaded or generated)
-                                    skills_data = {}
-                                    
-                                    if 'parsed_resume' in st.session_state and st.session_state.parsed_resume:
-                                        # For uploaded resumes
-                                        skills_data = {
-                                            'programming_languages': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('programming_languages', []),
-                                            'frameworks_libraries': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('frameworks_libraries', []),
-                                            'soft_skills': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('soft_skills', []),
-                                            'tools_technologies': st.session_state.parsed_resume.get('scores', {}).get('detected_skills', {}).get('tools_technologies', [])
-                                        }
-                                    elif 'resume_data' in st.session_state and st.session_state.resume_data:
-                                        # For generated resumes
-                                        skills = st.session_state.resume_data.get('skills', {})
-                                        skills_data = {
-                                            'programming_languages': skills.get('programming', []),
-                                            'frameworks_libraries': skills.get('frameworks', []),
-                                            'soft_skills': skills.get('soft_skills', []),
-                                            'tools_technologies': skills.get('tools', [])
-                                        }
-                                        
-                                        # Clean up empty strings from lists
-                                        for category in skills_data:
-                                            skills_data[category] = [skill.strip() for skill in skills_data[category] if skill.strip()]
-
-                                    if not any(skills_data.values()):
-                                        st.warning("No skills data available. Please ensure your resume includes skills information.")
-                                        return
-
-                                    # Technical Skills Analysis
-                                    st.markdown("### Technical Skills Analysis")
-                                    
-                                    # Programming Languages
-                                    if skills_data.get('programming_languages'):
-                                        st.markdown("""
-                                        #### Programming Languages
-                                        Your resume demonstrates proficiency in multiple programming languages. Here's a detailed analysis:
-                                        """)
-                                        
-                                        langs = sorted(skills_data['programming_languages'])
-                                        st.markdown("**Core Languages:**")
-                                        st.markdown("\n".join([f"• `{lang}` - Demonstrated through projects and experience" 
-                                                            for lang in langs[:3]]))
-                                        
-                                        if len(langs) > 3:
-                                            st.markdown("\n**Additional Languages:**")
-                                            st.markdown("\n".join([f"• `{lang}`" for lang in langs[3:]]))
-                                        
-                                        st.markdown("""
-                                        **Analysis:**
-                                        Your programming language portfolio shows a good mix of modern and established technologies.
-                                        Consider focusing on deepening expertise in your core languages while maintaining working
-                                        knowledge of others.
-                                        """)
-
-                                    # Frameworks and Libraries
-                                    if skills_data.get('frameworks_libraries'):
-                                        st.markdown("""
-                                        #### Frameworks & Libraries
-                                        Your technical stack includes various frameworks and libraries:
-                                        """)
-                                        
-                                        frameworks = sorted(skills_data['frameworks_libraries'])
-                                        for fw in frameworks:
-                                            st.markdown(f"• `{fw}`")
-                                        
-                                        st.markdown("""
-                                        **Framework Proficiency:**
-                                        Your experience with these frameworks indicates a solid foundation in software development.
-                                        This diverse knowledge base allows you to adapt to different project requirements and
-                                        technical environments.
-                                        """)
-
-                                    # Professional Skills Analysis
-                                    st.markdown("### Professional Skills Analysis")
-                                    
-                                    if skills_data.get('soft_skills'):
-                                        st.markdown("""
-                                        #### Soft Skills & Professional Competencies
-                                        Your resume demonstrates the following professional capabilities:
-                                        """)
-                                        
-                                        soft_skills = sorted(skills_data['soft_skills'])
-                                        for skill in soft_skills:
-                                            st.markdown(f"• {skill}")
-                                        
-                                        st.markdown("""
-                                        **Professional Impact:**
-                                        Your soft skills complement your technical abilities, showing a well-rounded
-                                        professional profile. These skills are particularly valuable for:
-                                        • Team collaboration and leadership roles
-                                        • Project management and coordination
-                                        • Client interaction and communication
-                                        """)
-
-                                    # Tools and Technologies
-                                    if skills_data.get('tools_technologies'):
-                                        st.markdown("""
-                                        #### Tools & Technologies
-                                        Your proficiency extends to various development tools and technologies:
-                                        """)
-                                        
-                                        tools = sorted(skills_data['tools_technologies'])
-                                        for tool in tools:
-                                            st.markdown(f"• `{tool}`")
-                                        
-                                        st.markdown("""
-                                        **Technical Environment:**
-                                        Your experience with these tools indicates familiarity with modern development
-                                        practices and environments. This toolkit supports efficient development workflows
-                                        and collaborative work.
-                                        """)
-
-                                    # Overall Skills Assessment
-                                    st.markdown("### Overall Skills Assessment")
-                                    
-                                    # Calculate total skills and distributions
-                                    total_skills = sum(len(skills) for skills in skills_data.values())
-                                    
-                                    st.markdown(f"""
-                                    #### Comprehensive Analysis
-                                    
-                                    Your skill profile includes {total_skills} distinct competencies across various categories.
-                                    The distribution shows:
-                                    """)
-                                    
-                                    for category, skills in skills_data.items():
-                                        if skills:
-                                            percentage = (len(skills) / total_skills) * 100
-                                            st.markdown(f"• **{category.replace('_', ' ').title()}**: {len(skills)} skills ({percentage:.1f}%)")
-                                    
-                                    st.markdown("""
-                                    #### Key Observations
-                                    
-                                    1. **Technical Depth**
-                                       - Your technical skills show both breadth and depth
-                                       - Good balance between fundamental and specialized technologies
-                                       - Evidence of continuous learning and adaptation
-                                    
-                                    2. **Professional Development**
-                                       - Strong foundation in core development practices
-                                       - Demonstrated ability to work with modern tools
-                                       - Clear progression in skill acquisition
-                                    
-                                    3. **Areas of Excellence**
-                                       - Solid programming language foundation
-                                       - Practical experience with industry-standard tools
-                                       - Balance of technical and soft skills
-                                    """)
-
-                                    # Recommendations
-                                    st.markdown("""
-                                    ### Recommendations for Growth
-                                    
-                                    Based on your current skill set, consider:
-                                    
-                                    1. **Skill Enhancement**
-                                       - Deepen expertise in your primary programming languages
-                                       - Stay updated with the latest versions and features
-                                       - Practice through complex projects
-                                    
-                                    2. **Knowledge Expansion**
-                                       - Explore complementary technologies
-                                       - Focus on high-demand areas in your field
-                                       - Maintain awareness of industry trends
-                                    
-                                    3. **Professional Development**
-                                       - Seek opportunities to lead technical initiatives
-                                       - Share knowledge through mentoring or documentation
-                                       - Contribute to open-source projects
-                                    """)
-
-                                except Exception as e:
-                                    st.error(f"An error occurred in skills analysis: {str(e)}")
-                                    st.info("Please ensure your resume includes skills information and try again.")
-                            
-                            with tab4:
-                                st.subheader("ATS Analysis")
-                                
-                                if 'scores' in st.session_state.parsed_resume:
-                                    scores = st.session_state.parsed_resume['scores']
-                                    
-                                    # Core ATS Analysis
-                                    st.markdown("### ATS Score Overview")
-                                    
-                                    # Display scores in a clean layout
-                                    col1, col2, col3 = st.columns(3)
-                                    
-                                    with col1:
-                                        st.metric(
-                                            "Overall ATS Score",
-                                            f"{scores.get('total_score', 0)}%",
-                                            delta="Target: 85%+" if scores.get('total_score', 0) < 85 else None,
-                                            delta_color="inverse"
-                                        )
-                                        
-                                    with col2:
-                                        st.metric(
-                                            "Keyword Match",
-                                            f"{scores.get('keyword_score', 0)}%",
-                                            delta="Target: 80%+" if scores.get('keyword_score', 0) < 80 else None,
-                                            delta_color="inverse"
-                                        )
-                                        
-                                    with col3:
-                                        st.metric(
-                                            "Format Score",
-                                            f"{scores.get('format_score', 0)}%",
-                                            delta="Target: 90%+" if scores.get('format_score', 0) < 90 else None,
-                                            delta_color="inverse"
-                                        )
-                                        
-                                    # Score Breakdown
-                                    st.markdown("### Score Breakdown")
-                                    scores_df = pd.DataFrame({
-                                        'Category': [
-                                            'Content Quality',
-                                            'Skills Coverage',
-                                            'Keyword Optimization',
-                                            'Format & Structure',
-                                            'Readability'
-                                        ],
-                                        'Score': [
-                                            scores.get('content_score', 0),
-                                            scores.get('skills_score', 0),
-                                            scores.get('keyword_score', 0),
-                                            scores.get('format_score', 0),
-                                            scores.get('readability_score', 0)
-                                        ]
-                                    })
-                                    
-                                    # Display as bar chart
-                                    st.bar_chart(scores_df.set_index('Category'))
-                                    
-                                    # Quick Summary
-                                    total_score = scores.get('total_score', 0)
-                                    if total_score >= 85:
-                                        st.success("Your resume is well-optimized for ATS systems.")
-                                    elif total_score >= 70:
-                                        st.warning("Your resume meets basic ATS requirements but has room for improvement.")
-                                    else:
-                                        st.error("Your resume may need optimization for better ATS performance.")
-                                    
-                                else:
-                                    st.warning("No ATS analysis data available. Please ensure your resume has been properly analyzed.")
-                                
-                                st.markdown(ats_analysis['ats_analysis'])
-                            
-                            with tab5:
-                                st.subheader("Executive Summary Report")
-                                
-                                if 'scores' in st.session_state.parsed_resume:
-                                    total_score = st.session_state.parsed_resume['scores'].get('total_score', 0)
-                                    
-                                    # Overall Assessment
-                                    st.markdown("### Overall Assessment")
-                                    st.markdown("""
-                                    Your resume has been analyzed across multiple dimensions including content quality, 
-                                    ATS compatibility, skills presentation, and overall professional impact. Here's a 
-                                    comprehensive summary of the findings:
-                                    """)
-                                    
-                                    # Core Metrics Summary
-                                    st.markdown("#### Key Performance Metrics")
-                                    st.markdown(f"""
-                                    Your resume achieved an overall score of **{total_score}%** with the following key observations:
-
-                                    • **Content Strength**: {st.session_state.parsed_resume['scores'].get('content_score', 0)}%
-                                    - Measures the quality and relevance of your professional experience
-                                    - Evaluates the impact and clarity of your achievements
-                                    
-                                    • **ATS Compatibility**: {st.session_state.parsed_resume['scores'].get('keyword_score', 0)}%
-                                    - Assesses how well your resume aligns with ATS systems
-                                    - Evaluates keyword optimization and format compliance
-                                    
-                                    • **Skills Presentation**: {st.session_state.parsed_resume['scores'].get('skills_score', 0)}%
-                                    - Analyzes the breadth and depth of your technical capabilities
-                                    - Evaluates how effectively skills are contextualized
-                                    """)
-                                    
-                                    # Profile Analysis Summary
-                                    st.markdown("#### Professional Profile Analysis")
-                                    st.markdown("""
-                                    Your professional profile demonstrates the following characteristics:
-                                    
-                                    • **Experience Presentation**
-                                    - Career progression and achievements are effectively structured
-                                    - Professional impact is quantified where applicable
-                                    - Key responsibilities align with industry expectations
-                                    
-                                    • **Technical Expertise**
-                                    - Demonstrates proficiency in relevant technical domains
-                                    - Shows adaptability across different technologies
-                                    - Highlights practical application of skills
-                                    
-                                    • **Professional Development**
-                                    - Shows continuous learning and skill advancement
-                                    - Indicates ability to adapt to industry changes
-                                    - Demonstrates professional growth trajectory
-                                    """)
-
-                                    # Skills Distribution
-                                    if 'skills_data' in locals():
-                                        st.markdown("#### Skills Distribution")
-                                        st.markdown("""
-                                        Your skill set demonstrates the following distribution:
-                                        
-                                        • **Technical Competencies**
-                                        - Programming Languages: Core and supplementary technologies
-                                        - Frameworks & Tools: Industry-standard development tools
-                                        - Technical Methodologies: Development and deployment practices
-                                        
-                                        • **Professional Capabilities**
-                                        - Project Management: Planning and execution abilities
-                                        - Team Collaboration: Communication and leadership skills
-                                        - Problem Solving: Analytical and strategic thinking
-                                        """)
-                                    
-                                    # Overall Impact
-                                    st.markdown("#### Overall Professional Impact")
-                                    if total_score >= 85:
-                                        impact_assessment = """
-                                        Your resume presents a **strong professional profile** with:
-                                        
-                                        • **Exceptional Qualities**
-                                        - Well-optimized for ATS systems
-                                        - Clear demonstration of professional expertise
-                                        - Strong alignment with industry standards
-                                        - Effective communication of achievements
-                                        """
-                                    elif total_score >= 70:
-                                        impact_assessment = """
-                                        Your resume presents a **solid professional profile** with:
-                                        
-                                        • **Notable Strengths**
-                                        - Good foundation for ATS compatibility
-                                        - Clear presentation of professional experience
-                                        - Adequate skill demonstration
-                                        - Defined career progression
-                                        """
-                                    else:
-                                        impact_assessment = """
-                                        Your resume presents a **developing professional profile** with:
-                                        
-                                        • **Core Elements**
-                                        - Basic professional presentation
-                                        - Fundamental skill documentation
-                                        - Career experience outline
-                                        - Development opportunities identified
-                                        """
-                                    
-                                    st.markdown(impact_assessment)
-                                    
-                                    # Market Readiness
-                                    st.markdown("#### Market Readiness Assessment")
-                                    st.markdown(f"""
-                                    Based on the comprehensive analysis, your resume demonstrates:
-                                    
-                                    • **Overall Market Position**
-                                    - {'Strong' if total_score >= 85 else 'Moderate' if total_score >= 70 else 'Basic'} competitive standing
-                                    - {'Excellent' if total_score >= 85 else 'Good' if total_score >= 70 else 'Fair'} industry alignment
-                                    - {'High' if total_score >= 85 else 'Moderate' if total_score >= 70 else 'Basic'} professional impact
-                                    
-                                    • **Technical Readiness**
-                                    - {'Advanced' if st.session_state.parsed_resume['scores'].get('skills_score', 0) >= 85 else 'Intermediate' if st.session_state.parsed_resume['scores'].get('skills_score', 0) >= 70 else 'Basic'} technical proficiency
-                                    - {'Strong' if st.session_state.parsed_resume['scores'].get('content_score', 0) >= 85 else 'Good' if st.session_state.parsed_resume['scores'].get('content_score', 0) >= 70 else 'Basic'} experience documentation
-                                    - {'Excellent' if st.session_state.parsed_resume['scores'].get('keyword_score', 0) >= 85 else 'Good' if st.session_state.parsed_resume['scores'].get('keyword_score', 0) >= 70 else 'Basic'} keyword optimization
-                                    """)
-                                    
-                                else:
-                                    st.warning("No analysis data available. Please ensure your resume has been properly analyzed.")
-
-                            with tab6:
-                                st.subheader("Interactive Resume Analysis Visualization")
-                                
-                                if 'scores' in st.session_state.parsed_resume:
-                                    scores = st.session_state.parsed_resume['scores']
-                                    
-                                    # Create two columns for the visualizations
-                                    col1, col2 = st.columns(2)
-                                    
-                                    with col1:
-                                        # Radar Chart for Overall Scores
-                                        categories = ['Content', 'Skills', 'Keywords', 'Format', 'Readability']
-                                        values = [
-                                            scores.get('content_score', 0),
-                                            scores.get('skills_score', 0),
-                                            scores.get('keyword_score', 0),
-                                            scores.get('format_score', 0),
-                                            scores.get('readability_score', 0)
-                                        ]
-                                        
-                                        fig_radar = go.Figure()
-                                        fig_radar.add_trace(go.Scatterpolar(
-                                            r=values,
-                                            theta=categories,
-                                            fill='toself',
-                                            name='Your Resume'
-                                        ))
-                                        
-                                        fig_radar.update_layout(
-                                            polar=dict(
-                                                radialaxis=dict(
-                                                    visible=True,
-                                                    range=[0, 100]
-                                                )),
-                                            showlegend=False,
-                                            title="Resume Score Distribution"
-                                        )
-                                        
-                                        st.plotly_chart(fig_radar, use_container_width=True)
-                                    
-                                    with col2:
-                                        # Gauge chart for Overall ATS Score
-                                        total_score = scores.get('total_score', 0)
-                                        
-                                        fig_gauge = go.Figure(go.Indicator(
-                                            mode = "gauge+number",
-                                            value = total_score,
-                                            domain = {'x': [0, 1], 'y': [0, 1]},
-                                            gauge = {
-                                                'axis': {'range': [0, 100]},
-                                                'bar': {'color': "darkblue"},
-                                                'steps': [
-                                                    {'range': [0, 50], 'color': "lightgray"},
-                                                    {'range': [50, 70], 'color': "gray"},
-                                                    {'range': [70, 85], 'color': "lightblue"},
-                                                    {'range': [85, 100], 'color': "royalblue"}
-                                                ],
-                                                'threshold': {
-                                                    'line': {'color': "red", 'width': 4},
-                                                    'thickness': 0.75,
-                                                    'value': 85
-                                                }
-                                            },
-                                            title = {'text': "Overall ATS Score"}
-                                        ))
-                                        
-                                        st.plotly_chart(fig_gauge, use_container_width=True)
-                                    
-                                    # Skills Distribution Chart
-                                    if 'skills_data' in locals():
-                                        # Prepare skills data
-                                        skills_categories = list(skills_data.keys())
-                                        skills_counts = [len(skills) for skills in skills_data.values()]
-                                        
-                                        # Create a donut chart
-                                        fig_skills = go.Figure(data=[go.Pie(
-                                            labels=skills_categories,
-                                            values=skills_counts,
-                                            hole=.3,
-                                            textinfo='label+percent'
-                                        )])
-                                        
-                                        fig_skills.update_layout(
-                                            title="Skills Distribution",
-                                            annotations=[dict(text='Skills', x=0.5, y=0.5, font_size=20, showarrow=False)]
-                                        )
-                                        
-                                        st.plotly_chart(fig_skills, use_container_width=True)
-                                    
-                                    # Score Trends Bar Chart
-                                    score_data = pd.DataFrame({
-                                        'Category': ['Content Quality', 'Skills Coverage', 'Keyword Match', 'Format Score', 'Readability'],
-                                        'Score': [
-                                            scores.get('content_score', 0),
-                                            scores.get('skills_score', 0),
-                                            scores.get('keyword_score', 0),
-                                            scores.get('format_score', 0),
-                                            scores.get('readability_score', 0)
-                                        ],
-                                        'Target': [90, 85, 80, 90, 85]
-                                    })
-                                    
-                                    fig_bars = go.Figure()
-                                    fig_bars.add_trace(go.Bar(
-                                        name='Your Score',
-                                        x=score_data['Category'],
-                                        y=score_data['Score'],
-                                        marker_color='royalblue'
-                                    ))
-                                    fig_bars.add_trace(go.Bar(
-                                        name='Target Score',
-                                        x=score_data['Category'],
-                                        y=score_data['Target'],
-                                        marker_color='lightgray'
-                                    ))
-                                    
-                                    fig_bars.update_layout(
-                                        title="Score Comparison with Targets",
-                                        barmode='group',
-                                        yaxis_title="Score (%)",
-                                        xaxis_title="Categories"
-                                    )
-                                    
-                                    st.plotly_chart(fig_bars, use_container_width=True)
-                                    
-                                    # Interactive Metrics Explorer
-                                    st.subheader("Interactive Metrics Explorer")
-                                    
-                                    # Create selection for metrics
-                                    selected_metrics = st.multiselect(
-                                        "Select metrics to compare",
-                                        ['Content Score', 'Skills Score', 'Keyword Score', 'Format Score', 'Readability Score'],
-                                        default=['Content Score', 'Skills Score']
-                                    )
-                                    
-                                    if selected_metrics:
-                                        # Prepare data for selected metrics
-                                        metric_values = {
-                                            'Content Score': scores.get('content_score', 0),
-                                            'Skills Score': scores.get('skills_score', 0),
-                                            'Keyword Score': scores.get('keyword_score', 0),
-                                            'Format Score': scores.get('format_score', 0),
-                                            'Readability Score': scores.get('readability_score', 0)
-                                        }
-                                        
-                                        selected_data = {
-                                            metric: metric_values[metric]
-                                            for metric in selected_metrics
-                                        }
-                                        
-                                        # Create comparison chart
-                                        fig_compare = go.Figure()
-                                        for metric, value in selected_data.items():
-                                            fig_compare.add_trace(go.Bar(
-                                                name=metric,
-                                                x=[metric],
-                                                y=[value],
-                                                text=[f"{value}%"],
-                                                textposition='auto',
-                                            ))
-                                        
-                                        fig_compare.update_layout(
-                                            title="Metrics Comparison",
-                                            yaxis_title="Score (%)",
-                                            yaxis_range=[0, 100],
-                                            showlegend=False
-                                        )
-                                        
-                                        st.plotly_chart(fig_compare, use_container_width=True)
-                                    
-                                else:
-                                    st.warning("No analysis data available for visualization. Please ensure your resume has been properly analyzed.")
+                    # Store analysis in session state for later use
+                    st.session_state.ai_analysis = analysis
                     
-                    except Exception as e:
-                        st.error(f"An error occurred during AI analysis: {str(e)}")
-                        st.info("Please check your API key or try again later.")
-                
-        except Exception as e:
-            st.error(f"An error occurred while generating your resume: {str(e)}")
-            st.info("Please try again or contact support if the issue persists.")
+                    render_analysis_tabs(analysis, st.session_state.parsed_resume, "preview")
+            
+            except Exception as e:
+                st.error(f"An error occurred during AI analysis: {str(e)}")
+                st.info("Please check your API key or try again later.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
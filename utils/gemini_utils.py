@@ -1,6 +1,9 @@
 import google.generativeai as genai
 from typing import Dict, List, Tuple
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import asyncio
+import threading
 import time
 import json
 
@@ -37,20 +40,9 @@ def initialize_gemini(api_key: str):
             """)
         return None
 
-def analyze_resume_content(model, resume_data: Dict) -> Dict:
-    """Analyze resume content using Gemini API with rate limit handling"""
-    if not model:
-        return {
-            'profile_analysis': "AI analysis unavailable. Please check API configuration.",
-            'skills_analysis': "AI analysis unavailable. Please check API configuration."
-        }
-    
-    try:
-        # Add delay between requests to avoid rate limits
-        time.sleep(2)
-        
-        # Enhanced profile analysis prompt with more detailed instructions
-        profile_prompt = f"""
+def _profile_prompt(resume_data: Dict) -> str:
+    """Build the profile analysis prompt"""
+    return f"""
         As an expert resume reviewer and hiring manager with extensive experience in {resume_data['profile_summary']['target_role']} roles, 
         perform a comprehensive analysis of this professional profile:
 
@@ -99,14 +91,10 @@ def analyze_resume_content(model, resume_data: Dict) -> Dict:
         Focus on actionable, specific advice that will improve the resume's effectiveness.
         Prioritize recommendations based on their potential impact.
         """
-        
-        profile_response = model.generate_content(profile_prompt)
-        
-        # Add delay between requests
-        time.sleep(2)
-        
-        # Enhanced skills analysis prompt
-        skills_prompt = f"""
+
+def _skills_prompt(resume_data: Dict) -> str:
+    """Build the skills analysis prompt"""
+    return f"""
         As a senior technical recruiter specializing in {resume_data['profile_summary']['target_role']} positions,
         analyze these technical competencies:
 
@@ -156,37 +144,10 @@ def analyze_resume_content(model, resume_data: Dict) -> Dict:
         Focus on concrete, actionable recommendations.
         Consider both immediate needs and future career growth.
         """
-        
-        skills_response = model.generate_content(skills_prompt)
-        
-        return {
-            'profile_analysis': profile_response.text if profile_response else "Analysis failed",
-            'skills_analysis': skills_response.text if skills_response else "Analysis failed"
-        }
-    except Exception as e:
-        if "429" in str(e):  # Rate limit error
-            st.error("Rate limit exceeded. Please wait a few minutes before trying again.")
-            return {
-                'profile_analysis': "Analysis paused: Rate limit exceeded. Please try again in a few minutes.",
-                'skills_analysis': "Analysis paused: Rate limit exceeded. Please try again in a few minutes."
-            }
-        st.error(f"Error during resume analysis: {str(e)}")
-        return {
-            'profile_analysis': f"Analysis failed: {str(e)}",
-            'skills_analysis': f"Analysis failed: {str(e)}"
-        }
 
-def get_ats_optimization(model, resume_data: Dict) -> Dict:
-    """Get ATS optimization suggestions using Gemini API"""
-    if not model:
-        return {'ats_analysis': "ATS analysis unavailable. Please check API configuration."}
-    
-    try:
-        # Add delay before request
-        time.sleep(2)
-        
-        # Enhanced ATS analysis prompt with comprehensive scoring criteria
-        prompt = f"""
+def _ats_prompt(resume_data: Dict) -> str:
+    """Build the ATS optimization prompt"""
+    return f"""
         As an expert ATS (Applicant Tracking System) analyst, perform a detailed evaluation of this resume for the role of {resume_data['profile_summary']['target_role']}.
 
         Resume Content:
@@ -246,6 +207,60 @@ def get_ats_optimization(model, resume_data: Dict) -> Dict:
         Include both quick fixes and strategic improvements.
         Consider multiple ATS platforms' requirements.
         """
+
+def analyze_resume_content(model, resume_data: Dict) -> Dict:
+    """Analyze resume content using Gemini API with rate limit handling"""
+    if not model:
+        return {
+            'profile_analysis': "AI analysis unavailable. Please check API configuration.",
+            'skills_analysis': "AI analysis unavailable. Please check API configuration."
+        }
+    
+    try:
+        # Add delay between requests to avoid rate limits
+        time.sleep(2)
+        
+        # Enhanced profile analysis prompt with more detailed instructions
+        profile_prompt = _profile_prompt(resume_data)
+        
+        profile_response = model.generate_content(profile_prompt)
+        
+        # Add delay between requests
+        time.sleep(2)
+        
+        # Enhanced skills analysis prompt
+        skills_prompt = _skills_prompt(resume_data)
+        
+        skills_response = model.generate_content(skills_prompt)
+        
+        return {
+            'profile_analysis': profile_response.text if profile_response else "Analysis failed",
+            'skills_analysis': skills_response.text if skills_response else "Analysis failed"
+        }
+    except Exception as e:
+        if "429" in str(e):  # Rate limit error
+            st.error("Rate limit exceeded. Please wait a few minutes before trying again.")
+            return {
+                'profile_analysis': "Analysis paused: Rate limit exceeded. Please try again in a few minutes.",
+                'skills_analysis': "Analysis paused: Rate limit exceeded. Please try again in a few minutes."
+            }
+        st.error(f"Error during resume analysis: {str(e)}")
+        return {
+            'profile_analysis': f"Analysis failed: {str(e)}",
+            'skills_analysis': f"Analysis failed: {str(e)}"
+        }
+
+def get_ats_optimization(model, resume_data: Dict) -> Dict:
+    """Get ATS optimization suggestions using Gemini API"""
+    if not model:
+        return {'ats_analysis': "ATS analysis unavailable. Please check API configuration."}
+    
+    try:
+        # Add delay before request
+        time.sleep(2)
+        
+        # Enhanced ATS analysis prompt with comprehensive scoring criteria
+        prompt = _ats_prompt(resume_data)
         
         response = model.generate_content(prompt)
         return {
@@ -262,6 +277,93 @@ def get_ats_optimization(model, resume_data: Dict) -> Dict:
             'ats_analysis': f"Analysis failed: {str(e)}"
         }
 
+# Prefixes of the placeholder texts returned when an analysis could not run
+ANALYSIS_ERROR_PREFIXES = (
+    "AI analysis unavailable",
+    "ATS analysis unavailable",
+    "ATS analysis failed",
+    "Analysis failed",
+    "Analysis paused"
+)
+
+def is_analysis_error(text: str) -> bool:
+    """Check whether an analysis text is an error placeholder rather than real output"""
+    return not text or text.startswith(ANALYSIS_ERROR_PREFIXES)
+
+async def run_in_thread(func, *args):
+    """Run a blocking call in a worker thread that can still report through st.*"""
+    ctx = get_script_run_ctx()
+
+    def call():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args)
+
+    return await asyncio.to_thread(call)
+
+async def analyze_resume_content_async(model, resume_data: Dict) -> Dict:
+    """Async variant of analyze_resume_content"""
+    return await run_in_thread(analyze_resume_content, model, resume_data)
+
+async def get_ats_optimization_async(model, resume_data: Dict) -> Dict:
+    """Async variant of get_ats_optimization"""
+    return await run_in_thread(get_ats_optimization, model, resume_data)
+
+async def _gather_analysis(model, resume_data: Dict) -> Tuple[Dict, Dict]:
+    return await asyncio.gather(
+        analyze_resume_content_async(model, resume_data),
+        get_ats_optimization_async(model, resume_data)
+    )
+
+def run_resume_analysis(model, resume_data: Dict) -> Tuple[Dict, Dict]:
+    """Run the profile/skills and ATS analyses concurrently"""
+    analysis, ats_analysis = asyncio.run(_gather_analysis(model, resume_data))
+    return analysis, ats_analysis
+
+ANALYSIS_KEYS = ('profile_analysis', 'skills_analysis', 'ats_analysis')
+
+def _bundle_prompt(resume_data: Dict) -> str:
+    """Build a single prompt covering the profile, skills and ATS reviews"""
+    return f"""
+        Complete the three independent resume reviews below.
+
+        === profile_analysis ===
+        {_profile_prompt(resume_data)}
+
+        === skills_analysis ===
+        {_skills_prompt(resume_data)}
+
+        === ats_analysis ===
+        {_ats_prompt(resume_data)}
+
+        Respond ONLY with JSON of the form
+        {{"profile_analysis": str, "skills_analysis": str, "ats_analysis": str}}
+        where each value is the complete markdown-formatted review for that section.
+        """
+
+def analyze_resume_bundle(model, resume_data: Dict) -> Dict:
+    """Get profile, skills and ATS analysis from a single Gemini request"""
+    if not model:
+        analysis, ats_analysis = run_resume_analysis(model, resume_data)
+        return {**analysis, **ats_analysis}
+    
+    try:
+        response = model.generate_content(
+            _bundle_prompt(resume_data),
+            generation_config={'response_mime_type': 'application/json'}
+        )
+        bundle = json.loads(response.text)
+        return {key: str(bundle[key]) for key in ANALYSIS_KEYS}
+    except (ValueError, KeyError, TypeError):
+        # Blocked or malformed JSON response, fall back to the individual prompts
+        analysis, ats_analysis = run_resume_analysis(model, resume_data)
+        return {**analysis, **ats_analysis}
+    except Exception as e:
+        if "429" in str(e):  # Rate limit error
+            st.error("Rate limit exceeded. Please wait a few minutes before trying again.")
+            return dict.fromkeys(ANALYSIS_KEYS, "Analysis paused: Rate limit exceeded. Please try again in a few minutes.")
+        st.error(f"Error during resume analysis: {str(e)}")
+        return dict.fromkeys(ANALYSIS_KEYS, f"Analysis failed: {str(e)}")
+
 def generate_achievements_suggestions(model, resume_data: Dict) -> List[str]:
     """Generate achievement suggestions based on experience"""
     
@@ -1,9 +1,6 @@
 import pdfkit
 import os
-from datetime import datetime
-import subprocess
 import shutil
-import sys
 
 def find_wkhtmltopdf():
     """Find wkhtmltopdf executable in common installation paths"""
@@ -25,23 +22,9 @@ def find_wkhtmltopdf():
         
     return None
 
-def create_pdf(html_content, name):
-    """Convert HTML resume to PDF"""
-    temp_html = None
+def create_pdf(html_content):
+    """Convert HTML resume to PDF and return the PDF bytes"""
     try:
-        # Create output directory if not exists
-        output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(output_dir, f"{name.replace(' ', '_')}_Resume_{timestamp}.pdf")
-        
-        # Create a temporary HTML file
-        temp_html = os.path.join(output_dir, f"temp_{timestamp}.html")
-        with open(temp_html, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
         # Find wkhtmltopdf executable
         wkhtmltopdf_path = find_wkhtmltopdf()
         if not wkhtmltopdf_path:
@@ -64,35 +47,22 @@ def create_pdf(html_content, name):
             # Configure pdfkit to use the found wkhtmltopdf path
             config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
             
-            # Generate PDF using pdfkit with string input
-            pdfkit.from_string(
+            # Generate PDF in memory using pdfkit with string input
+            pdf_bytes = pdfkit.from_string(
                 html_content,
-                filename,
+                False,
                 options=options,
                 configuration=config
             )
             
-            if not os.path.exists(filename):
+            if not pdf_bytes:
                 raise Exception("PDF file was not created successfully")
                 
-            return filename
+            return pdf_bytes
             
         except Exception as pdf_error:
             raise Exception(f"PDF generation failed: {str(pdf_error)}")
             
     except Exception as e:
         print(f"Error generating PDF: {str(e)}")
-        if temp_html and os.path.exists(temp_html):
-            try:
-                os.remove(temp_html)
-            except:
-                pass
         raise
-        
-    finally:
-        # Clean up temporary HTML file
-        if temp_html and os.path.exists(temp_html):
-            try:
-                os.remove(temp_html)
-            except:
-                pass
\ No newline at end of file
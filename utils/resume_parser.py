@@ -5,22 +5,21 @@ from typing import Dict, Any
 import re
 from pathlib import Path
 import spacy
-import pandas as pd
-import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from collections import Counter
 import pdfplumber  # Add pdfplumber for better PDF text extraction
 
 class ResumeParser:
     def __init__(self):
-        # Load spaCy model for NER and text processing
+        # Load spaCy model for text processing. Entities and lemmas are never
+        # read; sentences, dependencies and noun chunks need the tagger and parser
+        exclude = ["ner", "lemmatizer"]
         try:
-            self.nlp = spacy.load("en_core_web_lg")
+            self.nlp = spacy.load("en_core_web_lg", exclude=exclude)
         except OSError:
             st.info("Downloading language model for the first time...")
             from spacy.cli import download
             download("en_core_web_lg")
-            self.nlp = spacy.load("en_core_web_lg")
+            self.nlp = spacy.load("en_core_web_lg", exclude=exclude)
         
         # Initialize common sections in resumes
         self.SECTIONS = [
@@ -111,8 +110,7 @@ class ResumeParser:
             
             return text
         except Exception as e:
-            st.error(f"Error extracting text from PDF: {str(e)}")
-            return ""
+            raise ValueError(f"Error extracting text from PDF: {str(e)}") from e
 
     def extract_text_from_docx(self, file) -> str:
         """Extract text from DOCX file"""
@@ -123,8 +121,7 @@ class ResumeParser:
                 text += paragraph.text + "\n"
             return text
         except Exception as e:
-            st.error(f"Error extracting text from DOCX: {str(e)}")
-            return ""
+            raise ValueError(f"Error extracting text from DOCX: {str(e)}") from e
 
     def extract_text(self, file) -> str:
         """Extract text based on file type"""
@@ -135,8 +132,7 @@ class ResumeParser:
         elif file_extension in ['.docx', '.doc']:
             return self.extract_text_from_docx(file)
         else:
-            st.error("Unsupported file format. Please upload PDF or DOCX files.")
-            return ""
+            raise ValueError("Unsupported file format. Please upload PDF or DOCX files.")
 
     def extract_target_role(self, text: str) -> str:
         """Extract target role from resume text"""
@@ -257,13 +253,14 @@ class ResumeParser:
 
     def calculate_ats_score(self, text: str, job_description: str = None) -> Dict[str, Any]:
         """Calculate enhanced ATS compatibility score"""
-        doc = self.nlp(text.lower())
+        lower_text = text.lower()
+        doc = self.nlp(lower_text)
         sections = self.extract_sections(text)
         
         # Extract skills with categories
         skills_by_category = {
             category: {skill for skill in skills 
-                      if skill in text.lower()}
+                      if skill in lower_text}
             for category, skills in self.SKILLS_DB.items()
         }
         
@@ -385,19 +382,20 @@ class ResumeParser:
             # Calculate TF-IDF similarity
             vectorizer = TfidfVectorizer(stop_words='english')
             try:
-                tfidf_matrix = vectorizer.fit_transform([text.lower(), job_description.lower()])
+                tfidf_matrix = vectorizer.fit_transform([lower_text, job_description.lower()])
                 similarity = (tfidf_matrix * tfidf_matrix.T).toarray()[0][1]
                 keyword_points = int(similarity * 25)
                 
-                # Extract key terms from job description
-                job_doc = self.nlp(job_description.lower())
+                # Extract key terms from job description (stop words and
+                # punctuation only need the tokenizer, not the full pipeline)
+                job_doc = self.nlp.make_doc(job_description.lower())
                 key_terms = [token.text for token in job_doc 
                            if not token.is_stop and not token.is_punct
                            and len(token.text) > 2]
                 
                 # Find missing important terms
                 missing_terms = [term for term in set(key_terms) 
-                               if term not in text.lower() 
+                               if term not in lower_text 
                                and len(term) > 3]
                 
                 if missing_terms:
@@ -454,7 +452,10 @@ class ResumeParser:
         return scores
 
     def get_parsed_data(self, file) -> Dict[str, Any]:
-        """Get complete parsed data from resume"""
+        """Get complete parsed data from resume
+        
+        Raises ValueError with a displayable message when the file can't be read.
+        """
         text = self.extract_text(file)
         if not text:
             return None